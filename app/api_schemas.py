@@ -0,0 +1,529 @@
+"""
+OpenAPI metadata for the views in app.views, applied with extend_schema(**...).
+"""
+
+from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, OpenApiResponse
+
+
+REGISTER_SCHEMA = {
+    'summary': "Initiate User Registration",
+    'description': "Initiate user registration by storing user data and sending OTP verification code to email. User account is not created until OTP is verified.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'username': {'type': 'string', 'description': 'Unique username'},
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+                'first_name': {'type': 'string', 'description': 'User first name'},
+                'last_name': {'type': 'string', 'description': 'User last name'},
+                'job_position': {'type': 'string', 'description': 'User job position', 'nullable': True},
+                'password': {'type': 'string', 'format': 'password', 'description': 'User password'},
+                'password_confirm': {'type': 'string', 'format': 'password', 'description': 'Password confirmation'},
+            },
+            'required': ['username', 'email', 'first_name', 'last_name', 'password', 'password_confirm']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Registration initiated, OTP sent to email",
+            response={
+                'type': 'object',
+                'properties': {
+                    'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error")
+    }
+}
+
+
+LOGIN_SCHEMA = {
+    'summary': "User Login",
+    'description': "Authenticate user with username and password to obtain JWT tokens.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'identifier': {'type': 'string', 'description': 'Username or email'},
+                'password': {'type': 'string', 'format': 'password', 'description': 'User password'},
+            },
+            'required': ['identifier', 'password']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Login successful",
+            response={
+                'type': 'object',
+                'properties': {
+                    'user': {
+                        'type': 'object',
+                        'properties': {
+                            'id': {'type': 'integer', 'description': 'User ID'},
+                            'username': {'type': 'string', 'description': 'Username'},
+                            'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                            'first_name': {'type': 'string', 'description': 'First name'},
+                            'last_name': {'type': 'string', 'description': 'Last name'},
+                            'job_position': {'type': 'string', 'description': 'Job position', 'nullable': True},
+                        }
+                    },
+                    'tokens': {
+                        'type': 'object',
+                        'properties': {
+                            'refresh': {'type': 'string', 'description': 'JWT refresh token'},
+                            'access': {'type': 'string', 'description': 'JWT access token'},
+                        }
+                    }
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - invalid credentials")
+    }
+}
+
+
+CV_EVALUATION_LIST_SCHEMA = {
+    'summary': "Get CV Evaluations",
+    'description': "Retrieve CV evaluation history for the authenticated user. Can filter by specific evaluation ID.",
+    'parameters': [
+        OpenApiParameter(
+            name='evaluation_id',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description='Optional evaluation ID to retrieve specific evaluation',
+            required=False
+        ),
+        OpenApiParameter(
+            name='limit',
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            description='Page size for the evaluation history (default 20, max 100)',
+            required=False
+        ),
+        OpenApiParameter(
+            name='offset',
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            description='Number of evaluations to skip, as returned in next_offset',
+            required=False
+        )
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description="CV evaluations retrieved successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'code': {'type': 'string', 'example': 'success'},
+                    'next_offset': {'type': 'integer', 'nullable': True, 'description': 'Offset of the next page, or null on the last page'},
+                    'result': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'id': {'type': 'string', 'description': 'Evaluation ID'},
+                                'cv_id': {'type': 'string', 'description': 'CV upload ID'},
+                                'prompt': {'type': 'string', 'description': 'Evaluation prompt'},
+                                'status': {'type': 'integer', 'enum': [0, 1, 2, 3], 'description': 'Evaluation status (0=pending, 1=processing, 2=completed, 3=failed)'},
+                                'ai_response': {'type': 'object', 'nullable': True, 'description': 'AI evaluation response'},
+                                'score': {'type': 'number', 'nullable': True, 'description': 'Evaluation score'},
+                                'error_message': {'type': 'string', 'nullable': True, 'description': 'Error message if evaluation failed'},
+                                'created_at': {'type': 'string', 'format': 'date-time', 'description': 'Creation timestamp'},
+                                'updated_at': {'type': 'string', 'format': 'date-time', 'description': 'Last update timestamp'},
+                                'cv_filename': {'type': 'string', 'nullable': True, 'description': 'Original CV filename'},
+                                'cv_uploaded_at': {'type': 'string', 'format': 'date-time', 'nullable': True, 'description': 'CV upload timestamp'},
+                            }
+                        }
+                    }
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Invalid limit or offset"),
+        401: OpenApiResponse(description="Unauthorized - authentication required"),
+        404: OpenApiResponse(description="Evaluation not found")
+    }
+}
+
+
+CV_EVALUATION_CREATE_SCHEMA = {
+    'summary': "Create CV Evaluation",
+    'description': "Upload a CV file (PDF) and create an evaluation request with a custom prompt.",
+    'request': {
+        'multipart/form-data': {
+            'type': 'object',
+            'properties': {
+                'file': {
+                    'type': 'string',
+                    'format': 'binary',
+                    'description': 'CV file to evaluate (PDF format, max 10MB)'
+                },
+                'prompt': {
+                    'type': 'string',
+                    'description': 'Evaluation prompt describing the requirements (minimum 10 characters)'
+                }
+            },
+            'required': ['file', 'prompt']
+        }
+    },
+    'responses': {
+        202: OpenApiResponse(
+            description="CV evaluation request accepted; the evaluation runs in the background",
+            response={
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'string', 'description': 'Evaluation request ID'},
+                    'status': {'type': 'integer', 'enum': [0], 'description': 'Initial status (0=pending)'},
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - invalid file or prompt"),
+        401: OpenApiResponse(description="Unauthorized - authentication required"),
+        413: OpenApiResponse(description="Request body larger than the upload limit (10MB); rejected before the file is read")
+    }
+}
+
+
+HEALTH_CHECK_SCHEMA = {
+    'summary': "Health Check",
+    'description': "Check the health status of all system services (MySQL, MongoDB, Celery).",
+    'responses': {
+        200: OpenApiResponse(
+            description="Health check completed",
+            response={
+                'type': 'object',
+                'properties': {
+                    'status': {'type': 'string', 'enum': ['healthy', 'unhealthy'], 'description': 'Overall system health'},
+                    'services': {
+                        'type': 'object',
+                        'properties': {
+                            'mysql': {'type': 'string', 'description': 'MySQL database status'},
+                            'mongodb': {'type': 'string', 'description': 'MongoDB database status'},
+                            'celery': {'type': 'string', 'description': 'Celery task queue status'}
+                        }
+                    }
+                }
+            }
+        )
+    }
+}
+
+
+CV_FILE_SCHEMA = {
+    'summary': "Download CV File",
+    'description': "Download a previously uploaded CV file by its ID.",
+    'parameters': [
+        OpenApiParameter(
+            name='file_id',
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.PATH,
+            description='Unique identifier of the CV file to download',
+            required=True
+        )
+    ],
+    'responses': {
+        200: OpenApiResponse(
+            description="File download successful",
+            response={
+                'type': 'string',
+                'format': 'binary',
+                'description': 'The CV file content'
+            }
+        ),
+        302: OpenApiResponse(
+            description="Redirect to the file in object storage (when CV_FILE_REDIRECT is enabled). "
+                        "The Location header holds a presigned URL that expires after CV_FILE_URL_TTL seconds "
+                        "and sets the download filename and content type."
+        ),
+        304: OpenApiResponse(
+            description="Not Modified - the If-None-Match ETag (the file checksum) or "
+                        "If-Modified-Since date still matches; no body is sent"
+        ),
+        400: OpenApiResponse(description="File ID missing or malformed"),
+        401: OpenApiResponse(description="Unauthorized - authentication required"),
+        404: OpenApiResponse(description="File not found"),
+        500: OpenApiResponse(description="Error reading file")
+    }
+}
+
+
+OTP_VERIFY_SCHEMA = {
+    'summary': "Verify OTP Code",
+    'description': "Verify OTP code to complete user registration. OTP codes are 6 digits, expire after 2 minutes, and allow maximum 5 verification attempts.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+                'code': {'type': 'string', 'minLength': 6, 'maxLength': 6, 'description': '6-digit OTP code'},
+            },
+            'required': ['email', 'code']
+        }
+    },
+    'responses': {
+        201: OpenApiResponse(
+            description="OTP verified successfully, user account created",
+            response={
+                'type': 'object',
+                'properties': {
+                    'user': {
+                        'type': 'object',
+                        'properties': {
+                            'id': {'type': 'integer', 'description': 'User ID'},
+                            'username': {'type': 'string', 'description': 'Username'},
+                            'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                            'first_name': {'type': 'string', 'description': 'First name'},
+                            'last_name': {'type': 'string', 'description': 'Last name'},
+                            'job_position': {'type': 'string', 'description': 'Job position', 'nullable': True},
+                        }
+                    },
+                    'tokens': {
+                        'type': 'object',
+                        'properties': {
+                            'refresh': {'type': 'string', 'description': 'JWT refresh token'},
+                            'access': {'type': 'string', 'description': 'JWT access token'},
+                        }
+                    }
+                }
+            }
+        ),
+        400: OpenApiResponse(description="OTP verification failed - invalid code, expired, or too many attempts"),
+    }
+}
+
+
+OTP_RESEND_SCHEMA = {
+    'summary': "Resend OTP Code",
+    'description': "Request a new OTP code for email verification. Rate limited to 1 request per minute. Only works if there's a pending registration for the email.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+            },
+            'required': ['email']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="New OTP sent successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="No pending registration found for this email"),
+        429: OpenApiResponse(description="Rate limited - please wait before requesting another OTP"),
+    }
+}
+
+
+PROFILE_GET_SCHEMA = {
+    'summary': "Get User Profile",
+    'description': "Retrieve the authenticated user's profile information.",
+    'responses': {
+        200: OpenApiResponse(
+            description="Profile retrieved successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer', 'description': 'User ID'},
+                    'username': {'type': 'string', 'description': 'Username'},
+                    'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                    'first_name': {'type': 'string', 'description': 'First name'},
+                    'last_name': {'type': 'string', 'description': 'Last name'},
+                    'job_position': {'type': 'string', 'description': 'Job position', 'nullable': True},
+                    'date_joined': {'type': 'string', 'format': 'date-time', 'description': 'Account creation date'},
+                    'last_login': {'type': 'string', 'format': 'date-time', 'description': 'Last login date'},
+                }
+            }
+        ),
+        401: OpenApiResponse(description="Unauthorized - authentication required")
+    }
+}
+
+
+PROFILE_UPDATE_SCHEMA = {
+    'summary': "Update User Profile",
+    'description': "Update the authenticated user's profile information. All fields are optional.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'username': {'type': 'string', 'description': 'Username'},
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+                'first_name': {'type': 'string', 'description': 'User first name'},
+                'last_name': {'type': 'string', 'description': 'User last name'},
+                'job_position': {'type': 'string', 'description': 'User job position', 'nullable': True},
+            }
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Profile updated successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer', 'description': 'User ID'},
+                    'username': {'type': 'string', 'description': 'Username'},
+                    'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                    'first_name': {'type': 'string', 'description': 'First name'},
+                    'last_name': {'type': 'string', 'description': 'Last name'},
+                    'job_position': {'type': 'string', 'description': 'Job position', 'nullable': True},
+                    'date_joined': {'type': 'string', 'format': 'date-time', 'description': 'Account creation date'},
+                    'last_login': {'type': 'string', 'format': 'date-time', 'description': 'Last login date'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error"),
+        401: OpenApiResponse(description="Unauthorized - authentication required")
+    }
+}
+
+
+PROFILE_DELETE_SCHEMA = {
+    'summary': "Delete User Account",
+    'description': "Delete the authenticated user's account. Requires password confirmation for security.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'password': {'type': 'string', 'format': 'password', 'description': 'User password for confirmation'},
+            },
+            'required': ['password']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Account deleted successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - invalid password"),
+        401: OpenApiResponse(description="Unauthorized - authentication required")
+    }
+}
+
+
+PASSWORD_CHANGE_SCHEMA = {
+    'summary': "Change User Password",
+    'description': "Change the authenticated user's password. Requires current password for verification.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'old_password': {'type': 'string', 'format': 'password', 'description': 'Current password'},
+                'new_password': {'type': 'string', 'format': 'password', 'description': 'New password'},
+                'new_password_confirm': {'type': 'string', 'format': 'password', 'description': 'New password confirmation'},
+            },
+            'required': ['old_password', 'new_password', 'new_password_confirm']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Password changed successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - invalid current password, passwords don't match, or new password same as old"),
+        401: OpenApiResponse(description="Unauthorized - authentication required")
+    }
+}
+
+
+PASSWORD_RESET_REQUEST_SCHEMA = {
+    'summary': "Request Password Reset",
+    'description': "Request a password reset by providing your email address. An OTP code will be sent to your email.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+            },
+            'required': ['email']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Password reset OTP sent successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'email': {'type': 'string', 'format': 'email', 'description': 'User email'},
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - email not found or OTP generation failed")
+    }
+}
+
+
+PASSWORD_RESET_VERIFY_SCHEMA = {
+    'summary': "Verify Password Reset OTP and Reset Password",
+    'description': "Verify the OTP code sent to your email and set a new password. OTP codes are 6 digits, expire after 2 minutes, and allow maximum 5 verification attempts.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+                'code': {'type': 'string', 'minLength': 6, 'maxLength': 6, 'description': '6-digit OTP code'},
+                'new_password': {'type': 'string', 'format': 'password', 'description': 'New password'},
+                'new_password_confirm': {'type': 'string', 'format': 'password', 'description': 'New password confirmation'},
+            },
+            'required': ['email', 'code', 'new_password', 'new_password_confirm']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="Password reset successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="Validation error - invalid OTP, passwords don't match, or password reset request expired")
+    }
+}
+
+
+PASSWORD_RESET_RESEND_SCHEMA = {
+    'summary': "Resend Password Reset OTP",
+    'description': "Request a new password reset OTP code. Rate limited to 1 request per minute. Only works if there's a pending password reset for the email.",
+    'request': {
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'email': {'type': 'string', 'format': 'email', 'description': 'User email address'},
+            },
+            'required': ['email']
+        }
+    },
+    'responses': {
+        200: OpenApiResponse(
+            description="New password reset OTP sent successfully",
+            response={
+                'type': 'object',
+                'properties': {
+                    'message': {'type': 'string', 'description': 'Success message'},
+                }
+            }
+        ),
+        400: OpenApiResponse(description="No pending password reset found for this email"),
+        429: OpenApiResponse(description="Rate limited - please wait before requesting another OTP")
+    }
+}
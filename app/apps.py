@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class CVScreeningAppConfig(AppConfig):
+    name = 'app'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from cv_screening.authentication import invalidate_cached_user
+
+        # Connected here rather than at import time so saves from every process
+        # (Celery workers, management commands, the shell) drop cached users
+        post_save.connect(invalidate_cached_user, sender='app.CustomUser', dispatch_uid='invalidate_cached_user_save')
+        post_delete.connect(invalidate_cached_user, sender='app.CustomUser', dispatch_uid='invalidate_cached_user_delete')
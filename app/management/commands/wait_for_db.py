@@ -2,16 +2,43 @@
 Django management command to wait for databases to be ready.
 """
 
+import asyncio
 import time
 import logging
 import os
 from django.core.management.base import BaseCommand
 from django.db import connection
-import mongoengine
-import redis
 
 logger = logging.getLogger(__name__)
 
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+
+
+def poll_until(probe, deadline, on_retry=None):
+    """
+    Call probe until it succeeds or the deadline passes.
+
+    Sleeps with exponential backoff between attempts, starting at
+    INITIAL_DELAY and doubling up to MAX_DELAY.
+
+    Returns:
+        bool: True if the probe succeeded before the deadline
+    """
+    delay = INITIAL_DELAY
+    while True:
+        try:
+            probe()
+            return True
+        except Exception as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if on_retry:
+                on_retry(e)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, MAX_DELAY)
+
 
 class Command(BaseCommand):
     help = 'Wait for databases to be ready'
@@ -26,51 +53,51 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         timeout = options['timeout']
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
         self.stdout.write('Waiting for databases...')
 
-        # Wait for MySQL
-        while True:
-            try:
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
-                self.stdout.write(self.style.SUCCESS('MySQL is ready'))
-                break
-            except Exception as e:
-                if time.time() - start_time > timeout:
-                    self.stderr.write(self.style.ERROR(f'MySQL not ready after {timeout} seconds'))
-                    return
-                self.stdout.write(f'Waiting for MySQL: {e}')
-                time.sleep(2)
-
-        # Wait for MongoDB
-        while True:
+        def probe_mysql():
+            # Probe runs in a worker thread; drop its thread-local connection
             try:
-                mongoengine.connection.get_db().command('ping')
-                self.stdout.write(self.style.SUCCESS('MongoDB is ready'))
-                break
-            except Exception as e:
-                if time.time() - start_time > timeout:
-                    self.stderr.write(self.style.ERROR(f'MongoDB not ready after {timeout} seconds'))
-                    return
-                self.stdout.write(f'Waiting for MongoDB: {e}')
-                time.sleep(2)
-
-        # Wait for Redis
+                # The handshake alone proves MySQL is reachable with valid credentials
+                connection.ensure_connection()
+            finally:
+                connection.close()
+
+        def probe_mongo():
+            import mongoengine
+            mongoengine.connection.get_db().command('ping')
+
         redis_host = os.getenv('REDIS_HOST', 'redis')
         redis_port = int(os.getenv('REDIS_PORT', '6379'))
-        while True:
-            try:
-                r = redis.Redis(host=redis_host, port=redis_port, socket_timeout=5)
-                r.ping()
-                self.stdout.write(self.style.SUCCESS('Redis is ready'))
-                break
-            except Exception as e:
-                if time.time() - start_time > timeout:
-                    self.stderr.write(self.style.ERROR(f'Redis not ready after {timeout} seconds'))
-                    return
-                self.stdout.write(f'Waiting for Redis: {e}')
-                time.sleep(2)
+
+        def probe_redis():
+            import redis
+            redis.Redis(host=redis_host, port=redis_port, socket_timeout=5).ping()
+
+        probes = [
+            ('MySQL', probe_mysql),
+            ('MongoDB', probe_mongo),
+            ('Redis', probe_redis),
+        ]
+        if not asyncio.run(self._wait_all(probes, deadline, timeout)):
+            return
 
         self.stdout.write(self.style.SUCCESS('All services are ready!'))
+
+    async def _wait_all(self, probes, deadline, timeout):
+        """Wait for all services concurrently; total time is the slowest one."""
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._wait_for, name, probe, deadline, timeout)
+            for name, probe in probes
+        ))
+        return all(results)
+
+    def _wait_for(self, name, probe, deadline, timeout):
+        ready = poll_until(probe, deadline, lambda e: self.stdout.write(f'Waiting for {name}: {e}'))
+        if ready:
+            self.stdout.write(self.style.SUCCESS(f'{name} is ready'))
+        else:
+            self.stderr.write(self.style.ERROR(f'{name} not ready after {timeout} seconds'))
+        return ready
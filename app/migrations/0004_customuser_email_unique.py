@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-15 00:00
+
+from django.db import migrations, models
+
+
+def check_conflicting_emails(apps, schema_editor):
+    """
+    Refuse to add the unique index while accounts share an email, compared
+    case-insensitively as MySQL's collation does. Which account keeps the
+    address is for an operator to decide, so the conflicting rows are listed
+    for manual resolution instead of being rewritten here.
+    """
+    CustomUser = apps.get_model('app', 'CustomUser')
+
+    groups = {}
+    for user_id, email in CustomUser.objects.exclude(email__isnull=True).order_by('id').values_list('id', 'email'):
+        groups.setdefault(email.lower(), []).append(user_id)
+    conflicts = {email: ids for email, ids in groups.items() if len(ids) > 1}
+    if conflicts:
+        rows = '\n'.join(f'  {email!r}: user ids {ids}' for email, ids in sorted(conflicts.items()))
+        raise RuntimeError(
+            'Cannot make CustomUser.email unique; resolve these shared emails '
+            '(blank ones can be set to NULL) and migrate again:\n' + rows
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_add_job_position_to_customuser'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_conflicting_emails, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='customuser',
+            name='email',
+            field=models.EmailField(blank=True, max_length=150, null=True, unique=True),
+        ),
+    ]
@@ -9,7 +9,7 @@ import mongoengine
 
 
 class CustomUser(AbstractUser):
-    email = models.EmailField(max_length=150, blank=True, null=True)
+    email = models.EmailField(max_length=150, blank=True, null=True, unique=True)
     first_name = models.CharField(max_length=100, blank=True, null=True)
     last_name = models.CharField(max_length=100, blank=True, null=True)
     job_position = models.CharField(max_length=200, blank=True, null=True)
@@ -48,6 +48,21 @@ class CustomUser(AbstractUser):
         user.save()
         return user
 
+    @classmethod
+    def create_user_prehashed(cls, username, password_hash, email=None, first_name=None, last_name=None, job_position=None):
+        """Create a user from an already hashed password, skipping set_password."""
+        user = cls(username=username, password=password_hash)
+        if email:
+            user.email = email
+        if first_name:
+            user.first_name = first_name
+        if last_name:
+            user.last_name = last_name
+        if job_position:
+            user.job_position = job_position
+        user.save()
+        return user
+
 
 class CVUpload(mongoengine.Document):
     user_id = mongoengine.StringField(required=True)
@@ -100,9 +115,9 @@ class CVEvaluationRequest(mongoengine.Document):
     meta = {
         'collection': 'cv_evaluation_requests',
         'indexes': [
-            'user_id',
-            'cv_id',
-            '-created_at'
+            # Serves filter(user_id=...).order_by('-created_at') without an in-memory sort
+            ('user_id', '-created_at'),
+            'cv_id'
         ]
     }
 
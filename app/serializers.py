@@ -1,19 +1,107 @@
+import hashlib
+import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 from cv_screening.exceptions import ValidationException, AuthenticationException, NotFoundException
 from bson import ObjectId
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
-from django.db import connection
+from django.db import connection, IntegrityError
+from django.db.models import BooleanField, ExpressionWrapper, Q
 import mongoengine
-from cv_screening.celery import app
+import pymongo
 from .models import CustomUser, CVUpload, CVEvaluationRequest
-from .tasks import evaluate_cv_task
 from .services.otp_service import otp_service
 from .services.email_service import email_service
 
 
+PDF_MAGIC = b'%PDF-'
+PDF_MIME_TYPE = 'application/pdf'
+MAX_CV_FILE_SIZE = 10 * 1024 * 1024
+MIN_PROMPT_LENGTH = 10
+# Room for the prompt and multipart framing on top of the file itself
+MAX_CV_UPLOAD_BODY_SIZE = MAX_CV_FILE_SIZE + 64 * 1024
+UPLOAD_CHUNK_SIZE = 1 << 20
+EVALUATION_PAGE_SIZE = 20
+MAX_EVALUATION_PAGE_SIZE = 100
+
+# Load balancers poll the health endpoint every few seconds; probe backends
+# at most once per window and keep each probe on a short timeout
+HEALTH_CACHE_TTL = 5
+HEALTH_PROBE_TIMEOUT = 0.2
+# Extra time a probe thread gets past its own timeout before it counts as hung
+HEALTH_RESULT_GRACE = 0.5
+# (expires_at, status), replaced in a single assignment so threads never see half an update
+_health_cache = (0.0, None)
+# MongoDB and Celery are probed off-thread so the three round trips overlap
+_health_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='health-probe')
+
+
+def find_user_conflict(username=None, email=None, exclude_id=None):
+    """
+    Return 'username' or 'email' for the field already taken by another user,
+    or None. Both are checked in one query, and which one matched is decided by
+    the database so it follows the column collation (case-insensitive on MySQL).
+    """
+    lookup = Q()
+    if username is not None:
+        lookup |= Q(username=username)
+    if email is not None:
+        lookup |= Q(email=email)
+    if not lookup:
+        return None
+
+    queryset = CustomUser.objects.filter(lookup)
+    if exclude_id is not None:
+        queryset = queryset.exclude(id=exclude_id)
+    if username is None:
+        return 'email' if queryset.exists() else None
+
+    username_taken = list(
+        queryset.annotate(
+            username_taken=ExpressionWrapper(Q(username=username), output_field=BooleanField())
+        ).values_list('username_taken', flat=True)[:2]
+    )
+    if any(username_taken):
+        return 'username'
+    return 'email' if username_taken else None
+
+
+def raise_for_duplicate_user(exc, username, email, exclude_id=None):
+    """
+    Map a unique constraint violation on CustomUser to the matching API error.
+
+    IntegrityError text differs between database backends, so look up which
+    field collides instead of parsing the message.
+    """
+    if find_user_conflict(username=username, email=email, exclude_id=exclude_id) == 'username':
+        raise ValidationException("username_exists", "Username already exists") from exc
+    raise ValidationException("email_exists", "Email already exists") from exc
+
+
+def build_auth_response(user):
+    """Issue a JWT pair for the user; each token is signed exactly once."""
+    refresh = RefreshToken.for_user(user)
+    access = refresh.access_token
+    return {
+        'user': {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'job_position': user.job_position,
+        },
+        'tokens': {
+            'refresh': str(refresh),
+            'access': str(access),
+        }
+    }
+
+
 class UserSerializer(serializers.Serializer):
     username = serializers.CharField(required=True)
     email = serializers.CharField(required=True)
@@ -24,14 +112,14 @@ class UserSerializer(serializers.Serializer):
     password_confirm = serializers.CharField(required=True, write_only=True)
 
     def validate(self, attrs):
-        if attrs['password'] != attrs['password_confirm']:
+        if not hmac.compare_digest(attrs['password'].encode(), attrs['password_confirm'].encode()):
             raise ValidationException("password_mismatch", "Passwords don't match")
 
         # Check uniqueness only against existing users (not pending registrations)
-        if CustomUser.objects.filter(username=attrs['username']).exists():
+        conflict = find_user_conflict(username=attrs['username'], email=attrs['email'])
+        if conflict == 'username':
             raise ValidationException("username_exists", "Username already exists")
-
-        if CustomUser.objects.filter(email=attrs['email']).exists():
+        if conflict == 'email':
             raise ValidationException("email_exists", "Email already exists")
 
         return attrs
@@ -48,8 +136,11 @@ class UserSerializer(serializers.Serializer):
         last_name = validated_data['last_name']
         job_position = validated_data.get('job_position', '')
 
+        # Hash once here so OTP verification doesn't pay for it and Redis never holds the raw password
+        password_hash = make_password(password)
+
         # Store pending registration in Redis
-        if not otp_service.store_pending_registration(username, email, password, first_name, last_name, job_position):
+        if not otp_service.store_pending_registration(username, email, password_hash, first_name, last_name, job_position):
             raise ValidationException("registration_failed", "Failed to initiate registration")
 
         # Generate and store OTP
@@ -58,7 +149,7 @@ class UserSerializer(serializers.Serializer):
             raise ValidationException("otp_generation_failed", "Failed to generate OTP")
 
         # Send OTP email
-        if not email_service.send_otp_email(email, otp_code):
+        if not email_service.queue_otp_email(email, otp_code):
             # Clean up on email failure
             otp_service.cleanup_expired_data(email)
             raise ValidationException("email_send_failed", "Failed to send verification email")
@@ -78,14 +169,12 @@ class LoginSerializer(serializers.Serializer):
         identifier = attrs['identifier']
         password = attrs['password']
 
-        user = authenticate(username=identifier, password=password)
+        # Resolve an email to its username up front so we only hash the password once
+        username = identifier
+        if '@' in identifier:
+            username = CustomUser.objects.filter(email=identifier).values_list('username', flat=True).first() or identifier
 
-        if user is None and '@' in identifier:
-            try:
-                user_obj = CustomUser.objects.get(email=identifier)
-                user = authenticate(username=user_obj.username, password=password)
-            except CustomUser.DoesNotExist:
-                user = None
+        user = authenticate(username=username, password=password)
 
         if user is None:
             raise AuthenticationException("invalid_credentials", "Invalid username or password")
@@ -94,23 +183,7 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
     def create(self, validated_data):
-        user = validated_data['user']
-        refresh = RefreshToken.for_user(user)
-
-        self._data = {
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'job_position': user.job_position,
-            },
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
-        }
+        self._data = build_auth_response(validated_data['user'])
         return True
 
 
@@ -119,16 +192,20 @@ class CVUploadSerializer(serializers.Serializer):
     file = serializers.FileField(required=True)
 
     def validate_prompt(self, value):
-        if len(value.strip()) < 10:
-            raise serializers.ValidationError("Prompt must be at least 10 characters long")
-        return value.strip()
+        value = value.strip()
+        if len(value) < MIN_PROMPT_LENGTH:
+            raise serializers.ValidationError(f"Prompt must be at least {MIN_PROMPT_LENGTH} characters long")
+        return value
 
     def validate_file(self, file):
-        if file.size > 10 * 1024 * 1024:
+        if file.size > MAX_CV_FILE_SIZE:
             raise serializers.ValidationError({"file": "File size must be less than 10MB"})
 
-        allowed_types = ['application/pdf']
-        if file.content_type not in allowed_types:
+        # Trust the file's magic bytes, not the client-supplied content type
+        file.seek(0)
+        header = file.read(len(PDF_MAGIC))
+        file.seek(0)
+        if header != PDF_MAGIC:
             raise serializers.ValidationError({"file": "Only PDF files are allowed"})
 
         return file
@@ -143,29 +220,39 @@ class CVUploadSerializer(serializers.Serializer):
         filename = f"{user_id}_{uploaded_file.name}"
 
         file_path = f"cvs/{filename}"
-        file_content = b''
-        for chunk in uploaded_file.chunks():
-            file_content += chunk
+        hasher = hashlib.sha256()
+        for chunk in uploaded_file.chunks(chunk_size=UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
 
-        saved_file = default_storage.save(file_path, ContentFile(file_content))
+        # Storage backends rewind and stream any File object, so hand over the upload as-is
+        saved_file = default_storage.save(file_path, uploaded_file)
 
+        # Generate ids client-side so both documents are built and validated
+        # before either write, and each save is a plain insert_one
         cv_upload = CVUpload(
+            id=ObjectId(),
             user_id=str(user_id),
             original_filename=uploaded_file.name,
             file_size=uploaded_file.size,
-            mime_type=uploaded_file.content_type,
-            storage_uri=saved_file  # Store relative path, not full URL
+            mime_type=PDF_MIME_TYPE,  # validated by magic bytes; the client's header is not trusted
+            storage_uri=saved_file,  # Store relative path, not full URL
+            checksum=hasher.hexdigest()
         )
-        cv_upload.save()
-
         evaluation = CVEvaluationRequest(
+            id=ObjectId(),
             user_id=str(user_id),
             cv_id=str(cv_upload.id),
             prompt=prompt
         )
-        evaluation.save()
+        cv_upload.validate()
+        evaluation.validate()
 
-        evaluate_cv_task.delay(str(evaluation.id))
+        cv_upload.save(force_insert=True, validate=False)
+        evaluation.save(force_insert=True, validate=False)
+
+        from .tasks import evaluate_cv_task
+        # Publish over a pooled broker connection; don't block the request on retries
+        evaluate_cv_task.apply_async(args=[str(evaluation.id)], retry=False)
 
         self._data = {
             'id': str(evaluation.id),
@@ -175,9 +262,38 @@ class CVUploadSerializer(serializers.Serializer):
         return True
 
 
+def serialize_cv_evaluation(evaluation):
+    """
+    Build the API representation of a raw evaluation document.
+
+    Takes the dict returned by pymongo (optionally with the joined CV upload
+    under 'cv') and maps it directly, bypassing DRF field binding per row.
+    """
+    cv_upload = evaluation.get('cv', {})
+    return {
+        'id': str(evaluation['_id']),
+        'cv_id': evaluation['cv_id'],
+        'prompt': evaluation['prompt'],
+        'status': evaluation.get('status', CVEvaluationRequest.STATUS_PENDING),
+        'ai_response': evaluation.get('ai_response', {}),
+        'score': evaluation.get('score'),
+        'error_message': evaluation.get('error_message'),
+        'created_at': evaluation.get('created_at'),
+        'updated_at': evaluation.get('updated_at'),
+        'cv_filename': cv_upload.get('original_filename'),
+        'cv_uploaded_at': cv_upload.get('uploaded_at'),
+    }
+
+
 class CVEvaluationSerializer(serializers.Serializer):
     evaluation_id = serializers.CharField(required=False)
 
+    # Fields returned to the client; everything else is left on the server
+    EVALUATION_FIELDS = (
+        'id', 'cv_id', 'prompt', 'status', 'ai_response', 'score',
+        'error_message', 'created_at', 'updated_at'
+    )
+
     def to_representation(self, instance):
         user = self.context['user']
         query_params = self.context.get('query_params', {})
@@ -188,74 +304,123 @@ class CVEvaluationSerializer(serializers.Serializer):
         }
 
         if evaluation_id:
-            try:
-                evaluations = CVEvaluationRequest.objects.filter(id=ObjectId(evaluation_id), user_id=str(user.id))
-                if not evaluations:
-                    raise NotFoundException("Evaluation request not found")
-            except ObjectId.InvalidId:
+            if not ObjectId.is_valid(evaluation_id):
                 raise NotFoundException("Evaluation request not found")
+            pipeline = [
+                {'$match': {'_id': ObjectId(evaluation_id), 'user_id': str(user.id)}},
+                {'$limit': 1},
+            ]
         else:
-            evaluations = CVEvaluationRequest.objects.filter(user_id=str(user.id)).order_by('-created_at')
-
-        for evaluation in evaluations:
-            cv_filename = None
-            cv_uploaded_at = None
-            try:
-                cv_upload = CVUpload.objects.get(id=ObjectId(evaluation.cv_id))
-                cv_filename = cv_upload.original_filename
-                cv_uploaded_at = cv_upload.uploaded_at
-            except CVUpload.DoesNotExist:
-                pass
-            data["result"].append({
-                'id': str(evaluation.id),
-                'cv_id': evaluation.cv_id,
-                'prompt': evaluation.prompt,
-                'status': evaluation.status,
-                'ai_response': evaluation.ai_response,
-                'score': evaluation.score,
-                'error_message': evaluation.error_message,
-                'created_at': evaluation.created_at,
-                'updated_at': evaluation.updated_at,
-                'cv_filename': cv_filename,
-                'cv_uploaded_at': cv_uploaded_at,
-            })
+            limit, offset = self._page_bounds(query_params)
+            # One extra row tells us whether another page exists
+            pipeline = [
+                {'$match': {'user_id': str(user.id)}},
+                {'$sort': {'created_at': -1}},
+                {'$skip': offset},
+                {'$limit': limit + 1},
+            ]
+
+        # Join each evaluation to its CV server-side so the whole page is one round trip
+        pipeline += [
+            {'$project': {field: 1 for field in self.EVALUATION_FIELDS if field != 'id'}},
+            {'$lookup': {
+                'from': CVUpload._get_collection_name(),
+                'let': {'cv_oid': {'$convert': {'input': '$cv_id', 'to': 'objectId', 'onError': None}}},
+                'pipeline': [
+                    {'$match': {'$expr': {'$eq': ['$_id', '$$cv_oid']}}},
+                    {'$project': {'original_filename': 1, 'uploaded_at': 1}},
+                ],
+                'as': 'cv',
+            }},
+            {'$unwind': {'path': '$cv', 'preserveNullAndEmptyArrays': True}},
+        ]
+        evaluations = list(CVEvaluationRequest._get_collection().aggregate(pipeline))
+
+        if evaluation_id and not evaluations:
+            raise NotFoundException("Evaluation request not found")
+        if not evaluation_id:
+            has_more = len(evaluations) > limit
+            evaluations = evaluations[:limit]
+            data["next_offset"] = offset + limit if has_more else None
+
+        # Plain comprehension over trusted DB values; no per-row DRF field machinery
+        data["result"] = [serialize_cv_evaluation(evaluation) for evaluation in evaluations]
         return data
 
+    def _page_bounds(self, query_params):
+        try:
+            limit = int(query_params.get('limit', EVALUATION_PAGE_SIZE))
+            offset = int(query_params.get('offset', 0))
+        except (TypeError, ValueError):
+            raise ValidationException("invalid_pagination", "limit and offset must be integers")
+        if limit < 1 or offset < 0:
+            raise ValidationException("invalid_pagination", "limit must be positive and offset non-negative")
+        return min(limit, MAX_EVALUATION_PAGE_SIZE), offset
+
 
 class HealthCheckSerializer(serializers.Serializer):
     def create(self, validated_data):
-        health_status = {
-            'status': 'healthy',
-            'services': {}
+        global _health_cache
+        now = time.monotonic()
+        expires_at, status = _health_cache
+        if status is None or now >= expires_at or validated_data.get('force'):
+            status = self._check_services()
+            _health_cache = (now + HEALTH_CACHE_TTL, status)
+
+        self._data = status
+        return True
+
+    def _check_services(self):
+        mongodb = _health_executor.submit(self._check_mongodb)
+        celery = _health_executor.submit(self._check_celery)
+        # Django database connections are per thread, so MySQL stays here
+        services = {
+            'mysql': self._check_mysql(),
+            'mongodb': self._probe_result(mongodb),
+            'celery': self._probe_result(celery),
         }
 
+        unhealthy = services['mysql'] != 'healthy' or services['mongodb'] != 'healthy'
+        return {
+            'status': 'unhealthy' if unhealthy else 'healthy',
+            'services': services
+        }
+
+    def _probe_result(self, future):
         try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                health_status['services']['mysql'] = 'healthy'
-        except Exception as e:
-            health_status['services']['mysql'] = f'unhealthy: {str(e)}'
-            health_status['status'] = 'unhealthy'
+            return future.result(timeout=HEALTH_PROBE_TIMEOUT + HEALTH_RESULT_GRACE)
+        except FutureTimeoutError:
+            return 'unhealthy: timed out'
 
+    def _check_mysql(self):
         try:
-            mongoengine.connection.get_db().command('ping')
-            health_status['services']['mongodb'] = 'healthy'
+            # Connect if needed, otherwise ping the existing connection
+            connection.ensure_connection()
+            if not connection.is_usable():
+                raise Exception('connection is not usable')
+            return 'healthy'
         except Exception as e:
-            health_status['services']['mongodb'] = f'unhealthy: {str(e)}'
-            health_status['status'] = 'unhealthy'
+            return f'unhealthy: {str(e)}'
 
+    def _check_mongodb(self):
         try:
-            inspect = app.control.inspect()
-            active_tasks = inspect.active()
-            if active_tasks:
-                health_status['services']['celery'] = 'healthy'
-            else:
-                health_status['services']['celery'] = 'healthy (no active tasks)'
+            # Bounds server selection as well as the command, so an unreachable
+            # MongoDB doesn't tie up a probe thread for the 30 s selection default
+            with pymongo.timeout(HEALTH_PROBE_TIMEOUT):
+                mongoengine.connection.get_db().command('ping')
+            return 'healthy'
         except Exception as e:
-            health_status['services']['celery'] = f'unhealthy: {str(e)}'
+            return f'unhealthy: {str(e)}'
 
-        self._data = health_status
-        return True
+    def _check_celery(self):
+        try:
+            from cv_screening.celery import app
+            inspect = app.control.inspect(timeout=HEALTH_PROBE_TIMEOUT)
+            if inspect.active():
+                return 'healthy'
+            return 'healthy (no active tasks)'
+        except Exception as e:
+            return f'unhealthy: {str(e)}'
 
 
 class OTPVerifySerializer(serializers.Serializer):
@@ -287,35 +452,30 @@ class OTPVerifySerializer(serializers.Serializer):
         if not registration_data:
             raise ValidationException("registration_not_found", "Registration data not found")
 
-        # Create the user account
-        user = CustomUser.create_user(
-            username=registration_data['username'],
-            password=registration_data['password'],  # Raw password - will be hashed by create_user
-            email=registration_data['email'],
-            first_name=registration_data['first_name'],
-            last_name=registration_data['last_name'],
-            job_position=registration_data.get('job_position', '')
-        )
+        # Registrations stored before passwords were hashed at sign-up carry the
+        # plaintext instead; they expire within minutes, so hash it here
+        password_hash = registration_data.get('password_hash')
+        if password_hash is None:
+            if 'password' not in registration_data:
+                raise ValidationException("registration_not_found", "Registration data not found")
+            password_hash = make_password(registration_data['password'])
 
-        # Issue JWT tokens
-        refresh = RefreshToken.for_user(user)
-
-        response_data = {
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'job_position': user.job_position,
-            },
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
-        }
+        # Create the user account; the unique constraints catch anyone who
+        # registered the same username/email while this OTP was pending
+        try:
+            user = CustomUser.create_user_prehashed(
+                username=registration_data['username'],
+                password_hash=password_hash,
+                email=registration_data['email'],
+                first_name=registration_data['first_name'],
+                last_name=registration_data['last_name'],
+                job_position=registration_data.get('job_position', '')
+            )
+        except IntegrityError as e:
+            raise_for_duplicate_user(e, registration_data['username'], registration_data['email'])
 
-        self._data = response_data
+        # Issue JWT tokens
+        self._data = build_auth_response(user)
         return True
 
 
@@ -326,12 +486,11 @@ class OTPResendSerializer(serializers.Serializer):
         email = validated_data['email']
 
         # Check if there's a pending registration
-        pending_data = otp_service.get_pending_registration(email)
+        pending_data, otp_data = otp_service.get_pending_and_otp(email)
         if not pending_data:
             raise ValidationException("no_pending_registration", "No pending registration found for this email")
 
         # Check OTP data for rate limiting
-        otp_data = otp_service.get_otp_data(email)
         if otp_data and not otp_service.can_resend_otp(otp_data):
             raise ValidationException("rate_limited", "Please wait at least 1 minute before requesting a new OTP")
 
@@ -341,7 +500,7 @@ class OTPResendSerializer(serializers.Serializer):
             raise ValidationException("otp_generation_failed", "Failed to generate new OTP")
 
         # Send new OTP email
-        if not email_service.send_otp_email(email, new_otp):
+        if not email_service.queue_otp_email(email, new_otp):
             # Clean up on email failure
             otp_service.cleanup_expired_data(email)
             raise ValidationException("email_send_failed", "Failed to send verification email")
@@ -383,19 +542,21 @@ class ProfileUpdateSerializer(serializers.Serializer):
     last_name = serializers.CharField(required=False, allow_blank=True)
     job_position = serializers.CharField(required=False, allow_blank=True, allow_null=True)
 
-    def validate_username(self, value):
-        """Check if username is unique (excluding current user)."""
+    def validate(self, attrs):
+        """Check username and email are unique (excluding current user) in one query."""
         user = self.context.get('user')
-        if user and CustomUser.objects.filter(username=value).exclude(id=user.id).exists():
-            raise ValidationException("username_exists", "Username already exists")
-        return value
+        username = attrs.get('username')
+        email = attrs.get('email')
+        if not user or (username is None and email is None):
+            return attrs
 
-    def validate_email(self, value):
-        """Check if email is unique (excluding current user)."""
-        user = self.context.get('user')
-        if user and CustomUser.objects.filter(email=value).exclude(id=user.id).exists():
+        conflict = find_user_conflict(username=username, email=email, exclude_id=user.id)
+        if conflict == 'username':
+            raise ValidationException("username_exists", "Username already exists")
+        if conflict == 'email':
             raise ValidationException("email_exists", "Email already exists")
-        return value
+
+        return attrs
 
     def to_representation(self, instance):
         """Return updated user profile data."""
@@ -417,7 +578,10 @@ class ProfileUpdateSerializer(serializers.Serializer):
         instance.first_name = validated_data.get('first_name', instance.first_name)
         instance.last_name = validated_data.get('last_name', instance.last_name)
         instance.job_position = validated_data.get('job_position', instance.job_position)
-        instance.save()
+        try:
+            instance.save()
+        except IntegrityError as e:
+            raise_for_duplicate_user(e, instance.username, instance.email, exclude_id=instance.id)
         return instance
 
 
@@ -463,11 +627,12 @@ class PasswordChangeSerializer(serializers.Serializer):
             raise ValidationException("invalid_old_password", "Current password is incorrect")
 
         # Check if new passwords match
-        if new_password != new_password_confirm:
+        if not hmac.compare_digest(new_password.encode(), new_password_confirm.encode()):
             raise ValidationException("password_mismatch", "New passwords don't match")
 
-        # Check if new password is different from old password
-        if user.check_password(new_password):
+        # Check if new password is different from old password; old_password is
+        # already verified against the stored hash, so a plain compare is enough
+        if new_password == old_password:
             raise ValidationException("same_password", "New password must be different from current password")
 
         return attrs
@@ -507,7 +672,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
             raise ValidationException("otp_generation_failed", "Failed to generate OTP. Please try again in a minute.")
 
         # Send OTP email
-        if not email_service.send_password_reset_otp_email(email, otp_code):
+        if not email_service.queue_otp_email(email, otp_code, email_service.KIND_PASSWORD_RESET):
             # Clean up on email failure
             otp_service.cleanup_password_reset_data(email)
             raise ValidationException("email_send_failed", "Failed to send password reset email")
@@ -543,7 +708,7 @@ class PasswordResetVerifySerializer(serializers.Serializer):
         new_password_confirm = attrs['new_password_confirm']
 
         # Check if passwords match
-        if new_password != new_password_confirm:
+        if not hmac.compare_digest(new_password.encode(), new_password_confirm.encode()):
             raise ValidationException("password_mismatch", "Passwords don't match")
 
         # Verify OTP code
@@ -616,7 +781,7 @@ class PasswordResetResendSerializer(serializers.Serializer):
             raise ValidationException("otp_generation_failed", "Failed to generate new OTP")
 
         # Send new OTP email
-        if not email_service.send_password_reset_otp_email(email, new_otp):
+        if not email_service.queue_otp_email(email, new_otp, email_service.KIND_PASSWORD_RESET):
             # Clean up on email failure
             otp_service.cleanup_password_reset_data(email)
             raise ValidationException("email_send_failed", "Failed to send password reset email")
@@ -1,16 +1,83 @@
 from abc import ABC, abstractmethod
+import functools
 import logging
 import structlog
 import time
-import json
+import orjson
 import os
 import re
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from .circuit_breaker import ai_circuit_breaker, CircuitBreakerOpenException
 
 logger = structlog.get_logger()
 
+# Pattern: ```json\n{...}\n```
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+_SYSTEM_PROMPT = """You are an expert HR professional evaluating CVs for job positions.
+Analyze the provided CV text against the job requirements and provide a detailed evaluation.
+
+Return your response as a JSON object with the following structure:
+{
+  "score": <number between 0-100>,
+  "rationale": "<detailed explanation of the evaluation>",
+  "matches": ["<skill1>", "<skill2>", ...],
+  "gaps": ["<missing requirement1>", "<missing requirement2>", ...]
+}
+
+Be specific and provide actionable feedback."""
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+_PAYLOAD_OPTIONS = {"temperature": 0.3, "max_tokens": 2000, "stream": False}
+
+
+@functools.lru_cache(maxsize=128)
+def _keyword_patterns(keywords: tuple) -> tuple:
+    """
+    One compiled case-insensitive pattern per keyword. Separate patterns
+    rather than one alternation, so a keyword inside a longer one ("java" in
+    "javascript") is still reported; searching them skips lowercasing the
+    whole CV text on every call.
+    """
+    return tuple(re.compile(re.escape(keyword), re.IGNORECASE) for keyword in keywords)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in text, or None.
+
+    Single linear scan that tracks brace depth and skips braces inside JSON
+    strings, replacing a backtracking regex that could go quadratic on
+    malformed responses.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 
 class AIClient(ABC):
     @abstractmethod
@@ -28,6 +95,19 @@ class OpenRouterClient(AIClient):
         self.model = model
         self.base_url = base_url
         self.timeout = 60  # 60 seconds timeout
+        self._completions_url = f"{base_url}/chat/completions"
+
+        # Keep-alive session so repeated evaluations reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://cv-screening-app.com",  # Optional
+            "X-Title": "CV Screening API"  # Optional
+        })
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def evaluate_cv(self, cv_text: str, prompt: str) -> dict:
         def _openrouter_evaluation():
@@ -37,24 +117,12 @@ class OpenRouterClient(AIClient):
                        model=self.model)
 
             try:
-                # Prepare the evaluation prompt
-                system_prompt = """You are an expert HR professional evaluating CVs for job positions.
-Analyze the provided CV text against the job requirements and provide a detailed evaluation.
-
-Return your response as a JSON object with the following structure:
-{
-  "score": <number between 0-100>,
-  "rationale": "<detailed explanation of the evaluation>",
-  "matches": ["<skill1>", "<skill2>", ...],
-  "gaps": ["<missing requirement1>", "<missing requirement2>", ...]
-}
-
-Be specific and provide actionable feedback."""
-
+                # Limit CV text to avoid token limits
+                cv_snippet = cv_text[:settings.CV_MAX_CHARS]
                 user_message = f"""Job Requirements: {prompt}
 
 CV Content:
-{cv_text[:8000]}  # Limit CV text to avoid token limits
+{cv_snippet}
 
 Please evaluate this CV against the job requirements."""
 
@@ -62,32 +130,22 @@ Please evaluate this CV against the job requirements."""
                 payload = {
                     "model": self.model,
                     "messages": [
-                        {"role": "system", "content": system_prompt},
+                        _SYSTEM_MESSAGE,
                         {"role": "user", "content": user_message}
                     ],
-                    "temperature": 0.3,
-                    "max_tokens": 2000,
-                    "stream": False
-                }
-
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://cv-screening-app.com",  # Optional
-                    "X-Title": "CV Screening API"  # Optional
+                    **_PAYLOAD_OPTIONS
                 }
 
                 # Make the API call
-                response = requests.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers,
+                response = self.session.post(
+                    self._completions_url,
+                    data=orjson.dumps(payload),
                     timeout=self.timeout
                 )
 
                 response.raise_for_status()
 
-                result = response.json()
+                result = orjson.loads(response.content)
 
                 # Extract the AI response
                 ai_response = result['choices'][0]['message']['content'].strip()
@@ -157,26 +215,24 @@ Please evaluate this CV against the job requirements."""
         Returns:
             Parsed JSON dict or None if parsing fails
         """
-        # First, try to extract JSON from markdown code blocks
-        # Pattern: ```json\n{...}\n```
-        json_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-        json_match = re.search(json_block_pattern, ai_response, re.DOTALL)
-        
-        if json_match:
-            json_str = json_match.group(1).strip()
-        else:
-            # Try to find JSON object in the response
-            # Look for { ... } pattern
-            json_object_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-            json_match = re.search(json_object_pattern, ai_response, re.DOTALL)
+        json_str = ai_response.strip()
+
+        # Bare JSON is the common case; only search for an embedded object otherwise
+        if not json_str.startswith('{'):
+            # Try to extract JSON from markdown code blocks
+            json_match = _JSON_BLOCK_RE.search(ai_response)
+
             if json_match:
-                json_str = json_match.group(0).strip()
+                json_str = json_match.group(1).strip()
             else:
-                json_str = ai_response.strip()
+                # Try to find JSON object in the response
+                json_object = _find_json_object(ai_response)
+                if json_object:
+                    json_str = json_object.strip()
         
         # Try to parse the JSON
         try:
-            parsed = json.loads(json_str)
+            parsed = orjson.loads(json_str)
             
             # Handle nested JSON in rationale field (if present)
             # Sometimes AI returns the actual evaluation JSON nested inside rationale
@@ -185,11 +241,11 @@ Please evaluate this CV against the job requirements."""
                 # Check if rationale contains nested JSON in markdown code block
                 if isinstance(rationale, str) and ('```json' in rationale or '```' in rationale):
                     # Try to extract nested JSON from rationale
-                    nested_match = re.search(json_block_pattern, rationale, re.DOTALL)
+                    nested_match = _JSON_BLOCK_RE.search(rationale)
                     if nested_match:
                         try:
                             nested_json_str = nested_match.group(1).strip()
-                            nested_json = json.loads(nested_json_str)
+                            nested_json = orjson.loads(nested_json_str)
                             # If nested JSON has score and matches, use it (it's likely the actual response)
                             if 'score' in nested_json and 'matches' in nested_json:
                                 logger.info("Found nested JSON in rationale with score and matches, using nested response",
@@ -204,12 +260,12 @@ Please evaluate this CV against the job requirements."""
                                     parsed['gaps'] = nested_json['gaps']
                                 logger.info("Merged nested JSON data from rationale",
                                           score=parsed['score'])
-                        except json.JSONDecodeError as e:
+                        except orjson.JSONDecodeError as e:
                             logger.warning(f"Failed to parse nested JSON in rationale: {e}")
                             pass
             
             return parsed
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             # Try one more time with cleaned string (remove markdown artifacts)
             try:
@@ -220,18 +276,19 @@ Please evaluate this CV against the job requirements."""
                 end_idx = cleaned.rfind('}')
                 if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
                     cleaned = cleaned[start_idx:end_idx + 1]
-                    return json.loads(cleaned)
-            except (json.JSONDecodeError, ValueError):
+                    return orjson.loads(cleaned)
+            except (orjson.JSONDecodeError, ValueError):
                 pass
             
             return None
 
     def _extract_keywords(self, text: str, keywords: list) -> list:
         """Simple keyword extraction from text"""
-        text_lower = text.lower()
         found_keywords = []
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
+        for keyword, pattern in zip(keywords, _keyword_patterns(tuple(keywords))):
+            if pattern.search(text):
                 found_keywords.append(keyword.capitalize())
-        return found_keywords[:5]  # Limit to 5 keywords
+                if len(found_keywords) == 5:  # Limit to 5 keywords
+                    break
+        return found_keywords
 
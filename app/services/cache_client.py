@@ -0,0 +1,22 @@
+"""
+Shared Redis client for caching binary payloads (parsed CV text, AI results).
+"""
+import functools
+import redis
+from django.conf import settings
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_client():
+    """
+    Return a process-wide Redis client that stores raw bytes.
+
+    Unlike the OTP client this does not decode responses, so compressed or
+    orjson-encoded values round-trip unchanged. Short socket timeouts keep a
+    slow or missing Redis from stalling the work the cache is meant to speed up.
+    """
+    return redis.Redis.from_url(
+        getattr(settings, 'CELERY_BROKER_URL', 'redis://redis:6379/0'),
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5
+    )
@@ -40,19 +40,23 @@ class CircuitBreaker:
         self._lock = threading.Lock()
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
-        with self._lock:
-            if self._state == CircuitBreakerState.OPEN:
-                if self._should_attempt_reset():
-                    self._state = CircuitBreakerState.HALF_OPEN
-                    logger.info("Circuit breaker transitioning to half-open")
-                else:
-                    raise CircuitBreakerOpenException("Circuit breaker is open")
+        # Attribute reads are atomic under the GIL, so the healthy CLOSED path
+        # skips the lock entirely; only state transitions take it
+        if self._state == CircuitBreakerState.OPEN:
+            with self._lock:
+                if self._state == CircuitBreakerState.OPEN:
+                    if self._should_attempt_reset():
+                        self._state = CircuitBreakerState.HALF_OPEN
+                        logger.info("Circuit breaker transitioning to half-open")
+                    else:
+                        raise CircuitBreakerOpenException("Circuit breaker is open")
 
         try:
             result = func(*args, **kwargs)
 
-            with self._lock:
-                self._on_success()
+            if self._state != CircuitBreakerState.CLOSED or self._failure_count:
+                with self._lock:
+                    self._on_success()
 
             return result
 
@@ -68,7 +72,7 @@ class CircuitBreaker:
     def _should_attempt_reset(self) -> bool:
         if self._last_failure_time is None:
             return False
-        return time.time() - self._last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self._last_failure_time >= self.recovery_timeout
 
     def _on_success(self):
         self._failure_count = 0
@@ -82,7 +86,7 @@ class CircuitBreaker:
 
     def _on_failure(self):
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
         self._success_count = 0
 
         if self._state == CircuitBreakerState.HALF_OPEN:
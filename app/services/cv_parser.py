@@ -1,22 +1,95 @@
+import io
 import logging
+import os
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Optional
-import fitz
-from pdfminer.high_level import extract_text
+import redis
+from django.conf import settings
+from .cache_client import get_cache_client
 
 logger = logging.getLogger(__name__)
 
+# PyMuPDF and pdfminer are imported where they are used: the web process imports
+# this module through app.tasks (to enqueue tasks) but never parses a PDF itself
+
+# The AI only sees the first few thousand characters, so stop parsing pages
+# once this much text has been gathered (long appendices are wasted work)
+MAX_CV_CHARS = settings.CV_MAX_CHARS
+
+# Parsed text depends only on the PDF bytes, so it outlives any one prompt
+CV_TEXT_CACHE_TTL = int(os.getenv('CV_TEXT_CACHE_TTL', 7 * 86400))
+
+# Recently parsed CVs kept in the worker itself, in front of Redis
+LOCAL_TEXT_CACHE_SIZE = 32
+_local_text_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _remember_text(content_hash: str, text: str) -> None:
+    _local_text_cache[content_hash] = text
+    _local_text_cache.move_to_end(content_hash)
+    while len(_local_text_cache) > LOCAL_TEXT_CACHE_SIZE:
+        _local_text_cache.popitem(last=False)
+
+
+def _pdfminer_extract_text(fp) -> str:
+    """
+    Extract text with pdfminer, skipping layout analysis.
+
+    pdfminer.high_level.extract_text always builds LAParams when given None,
+    and layout analysis is the most expensive part of a pdfminer parse. We only
+    need the words for evaluation, so drive TextConverter with laparams=None.
+    """
+    from pdfminer.converter import TextConverter
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    output = io.StringIO()
+    resource_manager = PDFResourceManager(caching=True)
+    with TextConverter(resource_manager, output, laparams=None) as converter:
+        interpreter = PDFPageInterpreter(resource_manager, converter)
+        for page in PDFPage.get_pages(fp, caching=True):
+            interpreter.process_page(page)
+            if output.tell() >= MAX_CV_CHARS:
+                break
+    return output.getvalue()
+
+
+def _pymupdf_extract_text(doc) -> str:
+    parts = []
+    length = 0
+    for page in doc:
+        text = page.get_text("text")
+        parts.append(text)
+        length += len(text)
+        if length >= MAX_CV_CHARS:
+            break
+    return "".join(parts)
+
 
 class CVParser(ABC):
     @abstractmethod
     def extract_text(self, file_path: str) -> Optional[str]:
         pass
 
+    @abstractmethod
+    def extract_text_from_bytes(self, data: bytes) -> Optional[str]:
+        pass
+
 
 class PDFMinerParser(CVParser):
     def extract_text(self, file_path: str) -> Optional[str]:
         try:
-            return extract_text(file_path)
+            with open(file_path, 'rb') as fp:
+                return _pdfminer_extract_text(fp)
+        except Exception as e:
+            logger.error(f"Error extracting text with pdfminer: {e}")
+            return None
+
+    def extract_text_from_bytes(self, data: bytes) -> Optional[str]:
+        try:
+            return _pdfminer_extract_text(io.BytesIO(data))
         except Exception as e:
             logger.error(f"Error extracting text with pdfminer: {e}")
             return None
@@ -25,12 +98,18 @@ class PDFMinerParser(CVParser):
 class PyMuPDFParser(CVParser):
     def extract_text(self, file_path: str) -> Optional[str]:
         try:
-            doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
+            import fitz
+            with fitz.open(file_path) as doc:
+                return _pymupdf_extract_text(doc)
+        except Exception as e:
+            logger.error(f"Error extracting text with PyMuPDF: {e}")
+            return None
+
+    def extract_text_from_bytes(self, data: bytes) -> Optional[str]:
+        try:
+            import fitz
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                return _pymupdf_extract_text(doc)
         except Exception as e:
             logger.error(f"Error extracting text with PyMuPDF: {e}")
             return None
@@ -38,13 +117,71 @@ class PyMuPDFParser(CVParser):
 
 class CVParserService:
     def __init__(self):
-        self.parsers = [PDFMinerParser(), PyMuPDFParser()]
+        # PyMuPDF is much faster than pdfminer; keep pdfminer as the fallback
+        self.parsers = [PyMuPDFParser(), PDFMinerParser()]
+
+    def extract_text(self, file_path: str, content_hash: Optional[str] = None) -> Optional[str]:
+        return self._extract(lambda parser: parser.extract_text(file_path), file_path, content_hash)
+
+    def extract_text_from_bytes(self, data: bytes, content_hash: Optional[str] = None) -> Optional[str]:
+        """Parse a PDF already held in memory, without writing it to disk first."""
+        return self._extract(lambda parser: parser.extract_text_from_bytes(data), "in-memory PDF", content_hash)
+
+    def _extract(self, parse, source: str, content_hash: Optional[str]) -> Optional[str]:
+        if content_hash:
+            cached = self._get_cached_text(content_hash)
+            if cached is not None:
+                return cached
 
-    def extract_text(self, file_path: str) -> Optional[str]:
         for parser in self.parsers:
-            text = parser.extract_text(file_path)
-            if text and text.strip():
-                return text.strip()
+            text = parse(parser)
+            # Unreadable, or no text found (PyMuPDF can miss text pdfminer
+            # decodes, e.g. odd font encodings); try the next parser
+            text = text.strip() if text else None
+            if not text:
+                continue
+            if content_hash:
+                self._cache_text(content_hash, text)
+            return text
 
-        logger.error(f"Failed to extract text from {file_path}")
+        logger.error(f"Failed to extract text from {source}")
         return None
+
+    def _get_cached_text(self, content_hash: str) -> Optional[str]:
+        text = _local_text_cache.get(content_hash)
+        if text is not None:
+            _local_text_cache.move_to_end(content_hash)
+            return text
+
+        key = f"cv_text:{content_hash}"
+        try:
+            cached = get_cache_client().get(key)
+        except redis.RedisError as e:
+            logger.warning(f"CV text cache read failed: {e}")
+            return None
+        if not cached:
+            return None
+
+        try:
+            text = zlib.decompress(cached).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError) as e:
+            # A corrupt or foreign value is a miss; drop it so the fresh parse replaces it
+            logger.warning(f"Discarding unreadable CV text cache entry {key}: {e}")
+            try:
+                get_cache_client().delete(key)
+            except redis.RedisError:
+                pass
+            return None
+        _remember_text(content_hash, text)
+        return text
+
+    def _cache_text(self, content_hash: str, text: str) -> None:
+        _remember_text(content_hash, text)
+        try:
+            get_cache_client().setex(
+                f"cv_text:{content_hash}",
+                CV_TEXT_CACHE_TTL,
+                zlib.compress(text.encode('utf-8'))
+            )
+        except redis.RedisError as e:
+            logger.warning(f"CV text cache write failed: {e}")
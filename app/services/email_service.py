@@ -2,7 +2,10 @@
 Email service for sending OTP verification emails.
 """
 import logging
-from django.core.mail import send_mail
+import smtplib
+import threading
+from typing import List
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
@@ -11,6 +14,55 @@ logger = logging.getLogger(__name__)
 class EmailService:
     """Service for sending email notifications."""
 
+    def __init__(self):
+        # One SMTP connection is kept open and reused, so bursts of OTP mails
+        # skip the TCP/TLS handshake and login for every message
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def send_many(self, messages: List[EmailMessage]) -> int:
+        """
+        Send messages over the shared SMTP connection.
+
+        Reconnects once if the server has dropped the idle connection.
+
+        Returns:
+            int: Number of messages sent
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = get_connection(fail_silently=False)
+            try:
+                self._connection.open()
+                return self._connection.send_messages(messages)
+            except smtplib.SMTPServerDisconnected:
+                self._connection.close()
+                self._connection.open()
+                return self._connection.send_messages(messages)
+
+    KIND_REGISTRATION = 'registration'
+    KIND_PASSWORD_RESET = 'password_reset'
+
+    def queue_otp_email(self, email: str, otp_code: str, kind: str = KIND_REGISTRATION) -> bool:
+        """
+        Hand an OTP email to a Celery worker so the request doesn't wait on SMTP.
+
+        Args:
+            email: Recipient's email address
+            otp_code: 6-digit OTP code to send
+            kind: KIND_REGISTRATION or KIND_PASSWORD_RESET
+
+        Returns:
+            bool: True if the email was queued, False otherwise
+        """
+        from app.tasks import send_otp_email_task
+        try:
+            send_otp_email_task.apply_async(args=[email, otp_code, kind], retry=False)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to queue {kind} OTP email to {email}: {str(e)}")
+            return False
+
     def send_otp_email(self, email: str, otp_code: str) -> bool:
         """
         Send OTP verification code via email.
@@ -38,13 +90,7 @@ CV Screening Platform
 """
             from_email = getattr(settings, 'EMAIL_HOST_USER', 'noreply@cvplatform.com')
 
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=[email],
-                fail_silently=False
-            )
+            self.send_many([EmailMessage(subject, message, from_email, [email])])
 
             logger.info(f"OTP email sent successfully to {email}")
             return True
@@ -80,13 +126,7 @@ CV Screening Platform
 """
             from_email = getattr(settings, 'EMAIL_HOST_USER', 'noreply@cvplatform.com')
 
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=[email],
-                fail_silently=False
-            )
+            self.send_many([EmailMessage(subject, message, from_email, [email])])
 
             logger.info(f"Password reset OTP email sent successfully to {email}")
             return True
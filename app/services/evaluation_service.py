@@ -1,5 +1,6 @@
 import logging
 from typing import Optional, Dict, Any
+from django.conf import settings
 from .cv_parser import CVParserService
 from .ai_client import AIClient
 
@@ -11,10 +12,29 @@ class CVEvaluationService:
         self.parser = CVParserService()
         self.ai_client = ai_client
 
-    def evaluate_cv(self, cv_file_path: str, prompt: str) -> Dict[str, Any]:
-        cv_text = self.parser.extract_text(cv_file_path)
+    def evaluate_cv(self, cv_file_path: str, prompt: str, content_hash: Optional[str] = None) -> Dict[str, Any]:
+        cv_text = self.parser.extract_text(cv_file_path, content_hash=content_hash)
         if not cv_text:
             raise Exception('Failed to extract text from CV')
 
+        cv_text = self._truncate(cv_text)
+
         result = self.ai_client.evaluate_cv(cv_text, prompt)
         return result
+
+    def evaluate_cv_from_bytes(self, file_bytes: bytes, prompt: str, content_hash: Optional[str] = None) -> Dict[str, Any]:
+        cv_text = self.parser.extract_text_from_bytes(file_bytes, content_hash=content_hash)
+        if not cv_text:
+            raise Exception('Failed to extract text from CV')
+
+        cv_text = self._truncate(cv_text)
+
+        return self.ai_client.evaluate_cv(cv_text, prompt)
+
+    def _truncate(self, cv_text: str) -> str:
+        """Bound the text sent to the AI client so prompt size and cost stay predictable."""
+        max_chars = settings.CV_MAX_CHARS
+        if len(cv_text) > max_chars:
+            logger.info(f"Truncating CV text from {len(cv_text)} to {max_chars} characters")
+            return cv_text[:max_chars]
+        return cv_text
@@ -36,19 +36,16 @@ class FileSecurityService:
     def _validate_pdf_content(self, file_obj) -> bool:
         try:
             file_obj.seek(0)
-            header = file_obj.read(8)
-            file_obj.seek(0)  
-            return header.startswith(b'%PDF-')
+            header = file_obj.read(5)
+            file_obj.seek(0)
+            return header == b'%PDF-'
         except Exception:
             return False
 
     def calculate_checksum(self, file_path: str) -> Optional[str]:
         try:
-            hash_sha256 = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                return hashlib.file_digest(f, 'sha256').hexdigest()
         except Exception as e:
             logger.error(f"Error calculating checksum: {e}")
             return None
@@ -1,9 +1,8 @@
 """
 Redis-based OTP service for email verification during registration.
 """
-import json
-import random
-import string
+import orjson
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Tuple
 import redis
@@ -15,33 +14,53 @@ from django.utils import timezone
 django.setup()
 
 
+# Check an OTP code and spend an attempt in one atomic step, so concurrent
+# wrong guesses can't both decrement from the same starting count.
+# Returns {status, otp_json}: -1 missing, -2 no attempts left, 0 wrong code, 1 match.
+VERIFY_OTP_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return {-1, ''}
+end
+local data = cjson.decode(raw)
+if data['attempts_left'] <= 0 then
+    return {-2, raw}
+end
+if data['code'] == ARGV[1] then
+    return {1, raw}
+end
+data['attempts_left'] = data['attempts_left'] - 1
+local encoded = cjson.encode(data)
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl > 0 then
+    redis.call('PSETEX', KEYS[1], ttl, encoded)
+else
+    redis.call('SET', KEYS[1], encoded)
+end
+return {0, encoded}
+"""
+
+
 class OTPService:
     """Redis-based service for handling OTP and pending registrations."""
 
+    # Shared by every OTPService instance in the process
+    _connection_pool = None
+
     def __init__(self):
         """Initialize Redis connection."""
-        redis_url = getattr(settings, 'CELERY_BROKER_URL', 'redis://redis:6379/0')
-        # Extract host and port from Redis URL
-        if redis_url.startswith('redis://'):
-            redis_url = redis_url.replace('redis://', '')
-        if '/' in redis_url:
-            host_port, db = redis_url.rsplit('/', 1)
-        else:
-            host_port = redis_url
-            db = '0'
-
-        if ':' in host_port:
-            host, port = host_port.split(':', 1)
-        else:
-            host = host_port
-            port = 6379
-
-        self.redis = redis.Redis(
-            host=host,
-            port=int(port),
-            db=int(db),
-            decode_responses=True
-        )
+        if OTPService._connection_pool is None:
+            redis_url = getattr(settings, 'CELERY_BROKER_URL', 'redis://redis:6379/0')
+            # from_url understands passwords, rediss:// TLS and query options
+            # Values are all orjson payloads, which orjson.loads reads straight
+            # from bytes, so skip redis-py's per-reply UTF-8 decode
+            OTPService._connection_pool = redis.ConnectionPool.from_url(
+                redis_url,
+                max_connections=32,
+                decode_responses=False
+            )
+        self.redis = redis.Redis(connection_pool=OTPService._connection_pool)
+        self._verify_script = self.redis.register_script(VERIFY_OTP_SCRIPT)
 
     def _get_pending_registration_key(self, email: str) -> str:
         """Get Redis key for pending registration."""
@@ -61,9 +80,9 @@ class OTPService:
 
     def generate_otp_code(self) -> str:
         """Generate a 6-digit random OTP code."""
-        return ''.join(random.choices(string.digits, k=6))
+        return f"{secrets.randbelow(1_000_000):06d}"
 
-    def store_pending_registration(self, username: str, email: str, password: str,
+    def store_pending_registration(self, username: str, email: str, password_hash: str,
                                    first_name: str, last_name: str, job_position: str = '') -> bool:
         """
         Store pending registration data in Redis.
@@ -71,7 +90,7 @@ class OTPService:
         Args:
             username: User's username
             email: User's email
-            password: Raw password (will be hashed when user is created)
+            password_hash: Password already hashed with make_password
             first_name: User's first name
             last_name: User's last name
             job_position: User's job position
@@ -80,11 +99,10 @@ class OTPService:
             bool: True if stored successfully
         """
         try:
-            # Store raw password - it will be hashed when user is created
             data = {
                 'username': username,
                 'email': email.lower(),
-                'password': password,  # Store raw password, not hashed
+                'password_hash': password_hash,
                 'first_name': first_name,
                 'last_name': last_name,
                 'job_position': job_position,
@@ -93,7 +111,7 @@ class OTPService:
 
             key = self._get_pending_registration_key(email)
             # Store for 5 minutes (2 minutes OTP expiry + 3 minutes buffer)
-            self.redis.setex(key, 300, json.dumps(data))
+            self.redis.setex(key, 300, orjson.dumps(data))
             return True
         except Exception:
             return False
@@ -112,11 +130,33 @@ class OTPService:
             key = self._get_pending_registration_key(email)
             data = self.redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception:
             return None
 
+    def get_pending_and_otp(self, email: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Retrieve pending registration and OTP data in a single round trip.
+
+        Args:
+            email: User's email
+
+        Returns:
+            Tuple[Optional[Dict], Optional[Dict]]: (registration data, OTP data)
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self._get_pending_registration_key(email))
+            pipe.get(self._get_otp_key(email))
+            pending, otp = pipe.execute()
+            return (
+                orjson.loads(pending) if pending else None,
+                orjson.loads(otp) if otp else None
+            )
+        except Exception:
+            return None, None
+
     def create_otp(self, email: str) -> Optional[str]:
         """
         Create and store OTP for email verification.
@@ -145,7 +185,7 @@ class OTPService:
 
             key = self._get_otp_key(email)
             # Store for 2 minutes (OTP expiry time)
-            self.redis.setex(key, 120, json.dumps(otp_data))
+            self.redis.setex(key, 120, orjson.dumps(otp_data))
             return code
         except Exception:
             return None
@@ -164,7 +204,7 @@ class OTPService:
             key = self._get_otp_key(email)
             data = self.redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception:
             return None
@@ -197,26 +237,26 @@ class OTPService:
         Returns:
             Tuple[bool, str]: (success, message)
         """
+        return self._verify_code(self._get_otp_key(email), code)
+
+    def _verify_code(self, key: str, code: str) -> Tuple[bool, str]:
+        """Check code against the OTP stored at key, spending an attempt if it is wrong."""
         try:
-            otp_data = self.get_otp_data(email)
-            if not otp_data:
+            status, raw = self._verify_script(keys=[key], args=[code])
+            if status == -1:
                 return False, "OTP not found or expired"
 
+            otp_data = orjson.loads(raw)
+
             # Check expiry
             expires_at = datetime.fromisoformat(otp_data['expires_at'])
             if timezone.now() > expires_at:
                 return False, "OTP has expired"
 
-            # Check attempts
-            if otp_data['attempts_left'] <= 0:
+            if status == -2:
                 return False, "Too many failed attempts"
 
-            # Check code
-            if otp_data['code'] != code:
-                # Decrement attempts
-                otp_data['attempts_left'] -= 1
-                key = self._get_otp_key(email)
-                self.redis.setex(key, 120, json.dumps(otp_data))
+            if status == 0:
                 return False, f"Invalid OTP. {otp_data['attempts_left']} attempts remaining"
 
             return True, "OTP verified successfully"
@@ -284,7 +324,7 @@ class OTPService:
 
             key = self._get_pending_password_reset_key(email)
             # Store for 5 minutes (2 minutes OTP expiry + 3 minutes buffer)
-            self.redis.setex(key, 300, json.dumps(data))
+            self.redis.setex(key, 300, orjson.dumps(data))
             return True
         except Exception:
             return False
@@ -303,7 +343,7 @@ class OTPService:
             key = self._get_pending_password_reset_key(email)
             data = self.redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception:
             return None
@@ -336,7 +376,7 @@ class OTPService:
 
             key = self._get_password_reset_otp_key(email)
             # Store for 2 minutes (OTP expiry time)
-            self.redis.setex(key, 120, json.dumps(otp_data))
+            self.redis.setex(key, 120, orjson.dumps(otp_data))
             return code
         except Exception:
             return None
@@ -355,7 +395,7 @@ class OTPService:
             key = self._get_password_reset_otp_key(email)
             data = self.redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception:
             return None
@@ -371,32 +411,7 @@ class OTPService:
         Returns:
             Tuple[bool, str]: (success, message)
         """
-        try:
-            otp_data = self.get_password_reset_otp_data(email)
-            if not otp_data:
-                return False, "OTP not found or expired"
-
-            # Check expiry
-            expires_at = datetime.fromisoformat(otp_data['expires_at'])
-            if timezone.now() > expires_at:
-                return False, "OTP has expired"
-
-            # Check attempts
-            if otp_data['attempts_left'] <= 0:
-                return False, "Too many failed attempts"
-
-            # Check code
-            if otp_data['code'] != code:
-                # Decrement attempts
-                otp_data['attempts_left'] -= 1
-                key = self._get_password_reset_otp_key(email)
-                self.redis.setex(key, 120, json.dumps(otp_data))
-                return False, f"Invalid OTP. {otp_data['attempts_left']} attempts remaining"
-
-            return True, "OTP verified successfully"
-
-        except Exception as e:
-            return False, f"Verification error: {str(e)}"
+        return self._verify_code(self._get_password_reset_otp_key(email), code)
 
     def complete_password_reset(self, email: str) -> Optional[Dict]:
         """
@@ -0,0 +1,26 @@
+"""
+Shared S3/MinIO client for direct object storage access.
+"""
+import functools
+import boto3
+from django.conf import settings
+
+
+@functools.lru_cache(maxsize=1)
+def get_s3_client():
+    """
+    Return a process-wide S3 client.
+
+    Building a client costs a botocore session and endpoint resolution, so it
+    is created once and reused; clients are thread-safe and keep their
+    urllib3 pool alive between calls.
+    """
+    return boto3.client(
+        's3',
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_S3_REGION_NAME,
+        config=settings.AWS_S3_CLIENT_CONFIG,
+        verify=settings.AWS_S3_USE_SSL
+    )
@@ -2,21 +2,87 @@
 Celery tasks for CV screening platform.
 """
 
+import hashlib
 import logging
 import os
-import tempfile
 from bson import ObjectId
 from celery import shared_task
+import orjson
+import redis
 import requests
+from requests.adapters import HTTPAdapter
 from django.core.files.storage import default_storage
 from .models import CVEvaluationRequest, CVUpload
+from .services.cache_client import get_cache_client
+from .services.email_service import email_service
 from .services.evaluation_service import CVEvaluationService
 from .services.ai_client import OpenRouterClient  # AI client for CV evaluation
 
 logger = logging.getLogger(__name__)
 
+_ai_client = None
 
-@shared_task(bind=True, max_retries=3)
+# Shared by every task in the worker so legacy HTTP downloads reuse connections
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+CV_DOWNLOAD_TIMEOUT = 30
+
+# Evaluations are cached by (model, CV checksum, prompt) so re-ingests skip parsing and the AI call
+EVALUATION_CACHE_TTL = int(os.getenv('CV_EVALUATION_CACHE_TTL', 86400))
+EVALUATION_RESULT_FIELDS = ('score', 'rationale', 'matches', 'gaps')
+
+
+def get_ai_client():
+    """Return the worker's AI client, created once so its HTTP session is reused."""
+    global _ai_client
+    if _ai_client is None:
+        _ai_client = OpenRouterClient(model="google/gemini-2.5-flash-lite")
+    return _ai_client
+
+
+def _evaluation_cache_key(checksum, prompt, model):
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return f"cv_eval:{model}:{checksum}:{prompt_hash}"
+
+
+def get_cached_evaluation(checksum, prompt, model):
+    """Return a previous evaluation of the same CV bytes and prompt, or None."""
+    try:
+        cached = get_cache_client().get(_evaluation_cache_key(checksum, prompt, model))
+    except redis.RedisError as e:
+        logger.warning(f"Evaluation cache read failed: {e}")
+        return None
+    if not cached:
+        return None
+
+    try:
+        result = orjson.loads(cached)
+    except orjson.JSONDecodeError:
+        result = None
+    # Prefer a fresh evaluation over reusing an entry of the wrong shape
+    if not isinstance(result, dict) or not all(field in result for field in EVALUATION_RESULT_FIELDS):
+        logger.warning(f"Ignoring malformed cached evaluation for CV checksum {checksum}")
+        return None
+
+    logger.info(f"Evaluation cache hit for CV checksum {checksum}")
+    return result
+
+
+def cache_evaluation(checksum, prompt, model, result):
+    try:
+        get_cache_client().setex(
+            _evaluation_cache_key(checksum, prompt, model),
+            EVALUATION_CACHE_TTL,
+            orjson.dumps(result)
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Evaluation cache write failed: {e}")
+
+
+# Ack after the task finishes so an evaluation lost with its worker is redelivered
+@shared_task(bind=True, max_retries=3, acks_late=True, reject_on_worker_lost=True)
 def evaluate_cv_task(self, evaluation_id):
     """
     Asynchronous task to evaluate a CV against a job prompt.
@@ -27,46 +93,48 @@ def evaluate_cv_task(self, evaluation_id):
     try:
         logger.info(f"Starting CV evaluation task for ID: {evaluation_id}")
 
-        CVEvaluationRequest.objects(id=ObjectId(evaluation_id)).update_one(
-            set__status=CVEvaluationRequest.STATUS_PROCESSING
+        # Mark as processing and load the request in one round trip
+        evaluation = CVEvaluationRequest.objects(id=ObjectId(evaluation_id)).only('cv_id', 'prompt').modify(
+            set__status=CVEvaluationRequest.STATUS_PROCESSING,
+            new=True
         )
+        if evaluation is None:
+            raise CVEvaluationRequest.DoesNotExist(f"Evaluation request {evaluation_id} not found")
 
-        evaluation = CVEvaluationRequest.objects.get(id=ObjectId(evaluation_id))
+        cv_upload = CVUpload.objects.only('storage_uri', 'checksum').get(id=ObjectId(evaluation.cv_id))
+        ai_client = get_ai_client()
 
-        cv_upload = CVUpload.objects.get(id=ObjectId(evaluation.cv_id))
-        try:
+        # Uploads carry a SHA-256 of their bytes, so a repeat can skip the download too
+        result = None
+        if cv_upload.checksum:
+            result = get_cached_evaluation(cv_upload.checksum, evaluation.prompt, ai_client.model)
+
+        if result is None:
             if cv_upload.storage_uri.startswith('http'):
                 # Direct HTTP URL (legacy support)
-                response = requests.get(cv_upload.storage_uri)
+                response = _http_session.get(cv_upload.storage_uri, timeout=CV_DOWNLOAD_TIMEOUT)
                 response.raise_for_status()
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                    temp_file.write(response.content)
-                    temp_file_path = temp_file.name
+                file_content = response.content
             else:
                 # S3/MinIO storage - download via storage API
-                from django.core.files.storage import default_storage
                 with default_storage.open(cv_upload.storage_uri, 'rb') as storage_file:
                     file_content = storage_file.read()
 
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                    temp_file.write(file_content)
-                    temp_file_path = temp_file.name
-            # Initialize OpenRouter AI client
-            ai_client = OpenRouterClient(model="google/gemini-2.5-flash-lite")
-            evaluation_service = CVEvaluationService(ai_client)
+            checksum = cv_upload.checksum or hashlib.sha256(file_content).hexdigest()
+            if not cv_upload.checksum:
+                result = get_cached_evaluation(checksum, evaluation.prompt, ai_client.model)
 
-            result = evaluation_service.evaluate_cv(
-                cv_file_path=temp_file_path,
-                prompt=evaluation.prompt
-            )
+            if result is None:
+                evaluation_service = CVEvaluationService(ai_client)
 
-        finally:
-            if 'temp_file_path' in locals() and cv_upload.storage_uri.startswith('http'):
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+                # Parse straight from memory; no temp file round trip
+                result = evaluation_service.evaluate_cv_from_bytes(
+                    file_bytes=file_content,
+                    prompt=evaluation.prompt,
+                    content_hash=checksum
+                )
+                if not result.get('error'):
+                    cache_evaluation(checksum, evaluation.prompt, ai_client.model, result)
 
         # Update evaluation with results
         if 'error' in result and result['error']:
@@ -106,3 +174,23 @@ def evaluate_cv_task(self, evaluation_id):
             raise self.retry(countdown=60 * (2 ** self.request.retries), exc=exc)
 
         return {'error': str(exc)}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=10)
+def send_otp_email_task(self, email, otp_code, kind):
+    """
+    Send an OTP email outside the request cycle.
+
+    Args:
+        email (str): Recipient's email address
+        otp_code (str): 6-digit OTP code
+        kind (str): EmailService.KIND_REGISTRATION or KIND_PASSWORD_RESET
+    """
+    if kind == email_service.KIND_PASSWORD_RESET:
+        sent = email_service.send_password_reset_otp_email(email, otp_code)
+    else:
+        sent = email_service.send_otp_email(email, otp_code)
+
+    if not sent:
+        # OTPs expire after 2 minutes, so keep the backoff short (10s, 20s, 40s)
+        raise self.retry(countdown=10 * (2 ** self.request.retries))
@@ -1,10 +1,17 @@
 import json
-from django.test import TestCase, override_settings
+import time
+import structlog
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
-from unittest.mock import patch
+from unittest.mock import Mock, patch
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+from django.http import HttpResponse, JsonResponse
+from cv_screening.authentication import CachedJWTAuthentication, USER_CACHE_KEY_PREFIX
+from cv_screening.middleware import APIGZipMiddleware
 
 
 class CVScreeningIntegrationTest(TestCase):
@@ -19,7 +26,7 @@ class CVScreeningIntegrationTest(TestCase):
     def test_complete_cv_evaluation_flow(self):
         pdf_file = SimpleUploadedFile(
             "test_cv.pdf",
-            b"fake pdf content for testing",
+            b"%PDF-1.4 fake pdf content for testing",
             content_type="application/pdf"
         )
 
@@ -33,7 +40,7 @@ class CVScreeningIntegrationTest(TestCase):
              patch('app.views.open', create=True) as mock_file, \
              patch('app.models.CVUpload.create') as mock_cv_create, \
              patch('app.models.CVEvaluationRequest.create') as mock_eval_create, \
-             patch('app.tasks.evaluate_cv_task.delay') as mock_task_delay:
+             patch('app.tasks.evaluate_cv_task.apply_async') as mock_task_apply:
             mock_cv_create.return_value = {
                 '_id': 'cv123',
                 'user_id': str(self.user.id),
@@ -53,12 +60,12 @@ class CVScreeningIntegrationTest(TestCase):
 
             response = self.client.post('/api/cv-evaluations/', upload_data, format='multipart')
 
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
             self.assertIn('id', response.data)
             self.assertEqual(response.data['status'], 'pending')
             mock_cv_create.assert_called_once()
             mock_eval_create.assert_called_once()
-            mock_task_delay.assert_called_once_with('eval123')
+            mock_task_apply.assert_called_once_with(args=['eval123'], retry=False)
 
     def test_evaluation_history_retrieval(self):
 
@@ -136,3 +143,166 @@ class CVScreeningIntegrationTest(TestCase):
             self.assertIn('mysql', response.data['services'])
             self.assertIn('mongodb', response.data['services'])
             self.assertIn('celery', response.data['services'])
+
+
+class MetricsEndpointTest(SimpleTestCase):
+    def setUp(self):
+        from cv_screening import metrics
+        # Start from a cold cache so the scrape has to render the registry
+        metrics._metrics_cache['expires_at'] = 0.0
+
+    def test_metrics_scrape_renders_registry(self):
+        response = self.client.get('/metrics/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'cv_screening_requests_total', response.content)
+
+
+class FakeCache:
+    """Dict-backed stand-in for the Redis cache client."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        self.cache = FakeCache()
+        patcher = patch('cv_screening.authentication.get_cache_client', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = get_user_model().objects.create_user(
+            username='cached', email='cached@example.com', password='testpass123'
+        )
+        self.token = AccessToken.for_user(self.user)
+        self.key = f'{USER_CACHE_KEY_PREFIX}{self.user.id}'
+        self.auth = CachedJWTAuthentication()
+
+    def test_cache_hit_skips_database(self):
+        self.auth.get_user(self.token)
+        self.assertNotIn(b'password', self.cache.data[self.key])
+        self.assertNotIn(b'is_superuser', self.cache.data[self.key])
+
+        with self.assertNumQueries(0):
+            user = self.auth.get_user(self.token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.email, 'cached@example.com')
+
+    def test_save_invalidates_cached_user(self):
+        self.auth.get_user(self.token)
+
+        self.user.first_name = 'Changed'
+        self.user.save()
+
+        self.assertNotIn(self.key, self.cache.data)
+        self.assertEqual(self.auth.get_user(self.token).first_name, 'Changed')
+
+    def test_delete_invalidates_cached_user(self):
+        self.auth.get_user(self.token)
+
+        self.user.delete()
+
+        self.assertNotIn(self.key, self.cache.data)
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    def test_deactivated_user_rejected(self):
+        self.auth.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    def test_authenticate_binds_user_to_log_context(self):
+        request = RequestFactory().get('/api/profile/', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.addCleanup(structlog.contextvars.clear_contextvars)
+
+        user, _ = self.auth.authenticate(request)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(structlog.contextvars.get_contextvars()['user_id'], str(self.user.pk))
+
+
+class APIGZipMiddlewareTest(SimpleTestCase):
+    body = {'results': ['x' * 50] * 20}
+
+    def _response(self, path, response):
+        request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING='gzip')
+        return APIGZipMiddleware(lambda request: response)(request)
+
+    def test_api_json_response_compressed(self):
+        response = self._response('/api/cv-evaluations/', JsonResponse(self.body))
+        self.assertEqual(response.get('Content-Encoding'), 'gzip')
+
+    def test_auth_response_not_compressed(self):
+        response = self._response('/api/auth/login/', JsonResponse(self.body))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_non_api_html_not_compressed(self):
+        response = self._response('/admin/', HttpResponse('<p>%s</p>' % ('x' * 1000)))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+class HealthCheckForceTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cached = {'status': 'healthy', 'services': {}}
+        patcher = patch('app.serializers._health_cache', (time.monotonic() + 60, cached))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('app.serializers.HealthCheckSerializer._check_services')
+    def test_force_ignored_for_non_staff(self, mock_check):
+        self.client.force_authenticate(user=get_user_model().objects.create_user(
+            username='member', email='member@example.com', password='testpass123'
+        ))
+
+        response = self.client.get('/api/health/?force=1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_check.assert_not_called()
+
+    @patch('app.serializers.HealthCheckSerializer._check_services')
+    def test_force_honoured_for_staff(self, mock_check):
+        mock_check.return_value = {'status': 'healthy', 'services': {}}
+        self.client.force_authenticate(user=get_user_model().objects.create_user(
+            username='operator', email='operator@example.com', password='testpass123', is_staff=True
+        ))
+
+        self.client.get('/api/health/?force=1')
+
+        mock_check.assert_called_once()
+
+
+class CVFileConditionalGetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            username='owner', email='owner@example.com', password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.file_id = '0123456789abcdef01234567'
+
+    @patch('app.views.default_storage')
+    @patch('app.views.CVUpload')
+    def test_matching_etag_returns_304_without_reading_storage(self, mock_cv_upload, mock_storage):
+        cv_upload = Mock(checksum='abc123', uploaded_at=None, id=self.file_id)
+        mock_cv_upload.objects.return_value.only.return_value.first.return_value = cv_upload
+
+        response = self.client.get(f'/api/cv-files/{self.file_id}/', HTTP_IF_NONE_MATCH='"abc123"')
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_storage.open.assert_not_called()
@@ -3,9 +3,12 @@ Unit tests for serializers.
 """
 
 import pytest
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.core.files.uploadedfile import SimpleUploadedFile
-from app.serializers import UserSerializer, CVUploadSerializer, CVEvaluationRequestSerializer
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import Mock, patch
+from app.models import CustomUser
+from app.serializers import UserSerializer, CVUploadSerializer, HealthCheckSerializer, OTPVerifySerializer, serialize_cv_evaluation
 
 
 class UserSerializerTest(TestCase):
@@ -38,14 +41,14 @@ class UserSerializerTest(TestCase):
         self.assertIn('password', serializer.errors)
 
 
-class CVUploadSerializerTest(TestCase):
+class CVUploadSerializerTest(SimpleTestCase):
     """Test CV upload serializer."""
 
     def test_cv_upload_serializer_valid_pdf(self):
         """Test CV upload serializer with valid PDF file."""
         pdf_file = SimpleUploadedFile(
             "test.pdf",
-            b"fake pdf content",
+            b"%PDF-1.4 fake pdf content",
             content_type="application/pdf"
         )
 
@@ -74,11 +77,28 @@ class CVUploadSerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn('file', serializer.errors)
 
+    def test_cv_upload_serializer_rejects_non_pdf_content(self):
+        """Test CV upload serializer with a PDF content type but non-PDF bytes."""
+        fake_pdf = SimpleUploadedFile(
+            "test.pdf",
+            b"not really a pdf",
+            content_type="application/pdf"
+        )
+
+        data = {
+            'file': fake_pdf,
+            'prompt': 'Looking for Python developer with Django experience'
+        }
+
+        serializer = CVUploadSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('file', serializer.errors)
+
     def test_cv_upload_serializer_short_prompt(self):
         """Test CV upload serializer with too short prompt."""
         pdf_file = SimpleUploadedFile(
             "test.pdf",
-            b"fake pdf content",
+            b"%PDF-1.4 fake pdf content",
             content_type="application/pdf"
         )
 
@@ -92,7 +112,7 @@ class CVUploadSerializerTest(TestCase):
         self.assertIn('prompt', serializer.errors)
 
 
-class CVEvaluationRequestSerializerTest(TestCase):
+class CVEvaluationRequestSerializerTest(SimpleTestCase):
     """Test CV evaluation request serializer."""
 
     def test_evaluation_serializer_with_data(self):
@@ -110,10 +130,47 @@ class CVEvaluationRequestSerializerTest(TestCase):
             'updated_at': '2024-01-01T00:00:00Z'
         }
 
-        serializer = CVEvaluationRequestSerializer(data)
-        self.assertTrue(serializer.is_valid())
+        result = serialize_cv_evaluation(data)
 
         # Check that _id is converted to id
-        result = serializer.to_representation(data)
         self.assertIn('id', result)
         self.assertEqual(result['id'], '507f1f77bcf86cd799439011')
+        self.assertEqual(result['score'], 85.0)
+        self.assertIsNone(result['cv_filename'])
+
+
+class HealthCheckSerializerTest(SimpleTestCase):
+    """Test HealthCheck serializer."""
+
+    def test_hung_probe_reported_unhealthy(self):
+        """A probe that doesn't finish in time is reported as unhealthy."""
+        future = Mock()
+        future.result.side_effect = FutureTimeoutError()
+
+        result = HealthCheckSerializer()._probe_result(future)
+
+        self.assertEqual(result, 'unhealthy: timed out')
+        self.assertIsNotNone(future.result.call_args.kwargs['timeout'])
+
+
+class OTPVerifySerializerTest(TestCase):
+    """Test OTP verify serializer."""
+
+    @patch('app.serializers.otp_service')
+    def test_verify_accepts_registration_with_plaintext_password(self, mock_otp_service):
+        """Registrations stored before the password_hash key still complete."""
+        mock_otp_service.verify_otp.return_value = (True, "OTP verified")
+        mock_otp_service.complete_registration.return_value = {
+            'username': 'legacy',
+            'email': 'legacy@example.com',
+            'password': 'password123',
+            'first_name': 'Legacy',
+            'last_name': 'User',
+        }
+
+        serializer = OTPVerifySerializer(data={'email': 'legacy@example.com', 'code': '123456'})
+        self.assertTrue(serializer.is_valid())
+        serializer.create(serializer.validated_data)
+
+        user = CustomUser.objects.get(username='legacy')
+        self.assertTrue(user.check_password('password123'))
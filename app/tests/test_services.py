@@ -2,31 +2,38 @@ import pytest
 import time
 import json
 import os
+import zlib
 from unittest.mock import Mock, patch, MagicMock
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from app.services.ai_client import OpenRouterClient
 from app.services.cv_parser import CVParserService
 from app.services.evaluation_service import CVEvaluationService
 from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerOpenException
+from app.tasks import get_cached_evaluation
 
 
 class OpenRouterClientTest(TestCase):
-    def setUp(self):
-        self.api_key = "test-api-key"
-        # Set environment variable for testing
-        os.environ['OPENROUTER_API_KEY'] = self.api_key
-        self.client = OpenRouterClient()
-
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.api_key = "test-api-key"
+        # Set environment variable for testing; the client holds no per-call state,
+        # so one instance (and its HTTP session) serves every test
+        os.environ['OPENROUTER_API_KEY'] = cls.api_key
+        cls.ai_client = OpenRouterClient()
+
+    @classmethod
+    def tearDownClass(cls):
         # Clean up environment variable
         if 'OPENROUTER_API_KEY' in os.environ:
             del os.environ['OPENROUTER_API_KEY']
+        super().tearDownClass()
 
-    @patch('app.services.ai_client.requests.post')
+    @patch('app.services.ai_client.requests.Session.post')
     def test_evaluate_cv_success_json_response(self, mock_post):
         # Mock successful API response with JSON
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'choices': [{
                 'message': {
                     'content': json.dumps({
@@ -38,11 +45,11 @@ class OpenRouterClientTest(TestCase):
                 }
             }],
             'usage': {'total_tokens': 150}
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        result = self.client.evaluate_cv("Sample CV content", "Python developer position")
+        result = self.ai_client.evaluate_cv("Sample CV content", "Python developer position")
 
         self.assertEqual(result['score'], 85.0)
         self.assertEqual(result['rationale'], 'Excellent match for the position')
@@ -53,46 +60,56 @@ class OpenRouterClientTest(TestCase):
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         self.assertEqual(call_args[0][0], 'https://openrouter.ai/api/v1/chat/completions')
-        request_data = call_args[1]['json']
+        request_data = json.loads(call_args[1]['data'])
 
         self.assertEqual(request_data['model'], 'qwen/qwen3-coder:free')
         self.assertEqual(len(request_data['messages']), 2)
         self.assertIn('system', request_data['messages'][0]['role'])
         self.assertIn('user', request_data['messages'][1]['role'])
 
-    @patch('app.services.ai_client.requests.post')
+    @patch('app.services.ai_client.requests.Session.post')
     def test_evaluate_cv_non_json_response(self, mock_post):
         # Mock API response with plain text (not JSON)
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'choices': [{
                 'message': {
                     'content': 'This is a plain text response without JSON structure. The candidate has good skills.'
                 }
             }]
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
 
-        result = self.client.evaluate_cv("Sample CV", "Developer position")
+        result = self.ai_client.evaluate_cv("Sample CV", "Developer position")
 
         # Should create fallback structure
         self.assertEqual(result['score'], 60.0)
         self.assertIn('plain text response', result['rationale'])
         self.assertEqual(result['gaps'], ['Unable to parse structured evaluation'])
 
-    @patch('app.services.ai_client.requests.post')
+    @patch('app.services.ai_client.requests.Session.post')
     def test_evaluate_cv_api_timeout(self, mock_post):
         # Mock timeout error
         mock_post.side_effect = TimeoutError("Request timed out")
 
-        result = self.client.evaluate_cv("Sample CV", "Developer position")
+        result = self.ai_client.evaluate_cv("Sample CV", "Developer position")
 
         # Should return circuit breaker fallback
         self.assertEqual(result['score'], 50.0)
         self.assertIn('Service temporarily unavailable', result['rationale'])
         self.assertIn('Circuit breaker open', result.get('error', ''))
 
+    def test_parse_ai_response_nested_object_in_text(self):
+        # JSON object with nested braces (including inside strings) surrounded by prose
+        ai_response = 'Here is the evaluation: {"score": 70, "rationale": "Uses {braces}", "matches": [], "gaps": [], "meta": {"v": 1}} Thanks!'
+
+        result = self.ai_client._parse_ai_response(ai_response)
+
+        self.assertEqual(result['score'], 70)
+        self.assertEqual(result['rationale'], 'Uses {braces}')
+        self.assertEqual(result['meta'], {'v': 1})
+
     def test_extract_keywords(self):
         # Test the keyword extraction helper method
         client = OpenRouterClient(api_key="test")
@@ -105,38 +122,90 @@ class OpenRouterClientTest(TestCase):
         self.assertIn('Python', result)
         self.assertIn('Javascript', result)
 
+    def test_extract_keywords_reports_overlapping_keywords(self):
+        client = OpenRouterClient(api_key="test")
+
+        text = "Built front ends in JavaScript."
+        keywords = ['javascript', 'java', 'script']
+
+        result = client._extract_keywords(text, keywords)
+        self.assertEqual(result, ['Javascript', 'Java', 'Script'])
+
 
-class CVParserServiceTest(TestCase):
+class CVParserServiceTest(SimpleTestCase):
     """Test CV parser service."""
 
     @patch('app.services.cv_parser.PDFMinerParser.extract_text')
-    def test_extract_text_pdfminer_success(self, mock_pdfminer):
-        mock_pdfminer.return_value = "Extracted text from PDF"
+    @patch('app.services.cv_parser.PyMuPDFParser.extract_text')
+    def test_extract_text_pymupdf_success(self, mock_pymupdf, mock_pdfminer):
+        mock_pymupdf.return_value = "Extracted text from PDF"
 
         service = CVParserService()
         result = service.extract_text("/path/to/file.pdf")
 
         self.assertEqual(result, "Extracted text from PDF")
+        mock_pymupdf.assert_called_once()
+        mock_pdfminer.assert_not_called()
+
+    @patch('app.services.cv_parser.PDFMinerParser.extract_text')
+    @patch('app.services.cv_parser.PyMuPDFParser.extract_text')
+    def test_extract_text_fallback_to_pdfminer(self, mock_pymupdf, mock_pdfminer):
+        mock_pymupdf.return_value = None
+        mock_pdfminer.return_value = "Extracted text from pdfminer"
+
+        service = CVParserService()
+        result = service.extract_text("/path/to/file.pdf")
+
+        self.assertEqual(result, "Extracted text from pdfminer")
+        mock_pymupdf.assert_called_once()
         mock_pdfminer.assert_called_once()
 
     @patch('app.services.cv_parser.PDFMinerParser.extract_text')
     @patch('app.services.cv_parser.PyMuPDFParser.extract_text')
-    def test_extract_text_fallback_to_pymupdf(self, mock_pymupdf, mock_pdfminer):
-        mock_pdfminer.return_value = None
-        mock_pymupdf.return_value = "Extracted text from PyMuPDF"
+    def test_extract_text_empty_pymupdf_falls_back_to_pdfminer(self, mock_pymupdf, mock_pdfminer):
+        mock_pymupdf.return_value = "  \n"
+        mock_pdfminer.return_value = "Extracted text from pdfminer"
 
         service = CVParserService()
         result = service.extract_text("/path/to/file.pdf")
 
-        self.assertEqual(result, "Extracted text from PyMuPDF")
+        self.assertEqual(result, "Extracted text from pdfminer")
         mock_pdfminer.assert_called_once()
-        mock_pymupdf.assert_called_once()
 
+    @patch('app.services.cv_parser.get_cache_client')
+    @patch('app.services.cv_parser.PyMuPDFParser.extract_text')
+    def test_extract_text_cached_by_content_hash(self, mock_pymupdf, mock_cache_client):
+        mock_cache_client.return_value.get.return_value = zlib.compress(b"Cached CV text")
+
+        service = CVParserService()
+        result = service.extract_text("/path/to/file.pdf", content_hash="abc123")
+
+        self.assertEqual(result, "Cached CV text")
+        mock_cache_client.return_value.get.assert_called_once_with("cv_text:abc123")
+        mock_pymupdf.assert_not_called()
+
+
+    @patch('app.services.cv_parser.get_cache_client')
+    @patch('app.services.cv_parser.PyMuPDFParser.extract_text')
+    def test_extract_text_corrupt_cache_entry_reparsed(self, mock_pymupdf, mock_cache_client):
+        mock_cache_client.return_value.get.return_value = b"not zlib data"
+        mock_pymupdf.return_value = "Extracted text from PDF"
+
+        service = CVParserService()
+        result = service.extract_text("/path/to/file.pdf", content_hash="corrupt123")
+
+        self.assertEqual(result, "Extracted text from PDF")
+        mock_cache_client.return_value.delete.assert_called_once_with("cv_text:corrupt123")
 
 class CVEvaluationServiceTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.mock_ai_client = Mock()
+        cls.service = CVEvaluationService(cls.mock_ai_client)
+
     def setUp(self):
-        self.mock_ai_client = Mock()
-        self.service = CVEvaluationService(self.mock_ai_client)
+        self.mock_ai_client.reset_mock(return_value=True, side_effect=True)
 
     @patch('app.services.evaluation_service.CVParserService.extract_text')
     def test_evaluate_cv_success(self, mock_extract):
@@ -151,9 +220,20 @@ class CVEvaluationServiceTest(TestCase):
         result = self.service.evaluate_cv("/path/to/cv.pdf", "Python developer")
 
         self.assertEqual(result['score'], 85.0)
-        mock_extract.assert_called_once_with("/path/to/cv.pdf")
+        mock_extract.assert_called_once_with("/path/to/cv.pdf", content_hash=None)
         self.mock_ai_client.evaluate_cv.assert_called_once()
 
+    @patch('app.services.evaluation_service.CVParserService.extract_text_from_bytes')
+    def test_evaluate_cv_from_bytes(self, mock_extract):
+        mock_extract.return_value = "Sample CV content"
+        self.mock_ai_client.evaluate_cv.return_value = {'score': 70.0}
+
+        result = self.service.evaluate_cv_from_bytes(b"%PDF-1.4", "Python developer", content_hash="abc123")
+
+        self.assertEqual(result['score'], 70.0)
+        mock_extract.assert_called_once_with(b"%PDF-1.4", content_hash="abc123")
+        self.mock_ai_client.evaluate_cv.assert_called_once_with("Sample CV content", "Python developer")
+
     @patch('app.services.evaluation_service.CVParserService.extract_text')
     def test_evaluate_cv_parsing_failed(self, mock_extract):
         mock_extract.return_value = None
@@ -164,7 +244,7 @@ class CVEvaluationServiceTest(TestCase):
         self.assertIn('Failed to extract text', result['error'])
 
 
-class CircuitBreakerTest(TestCase):
+class CircuitBreakerTest(SimpleTestCase):
     def setUp(self):
         self.cb = CircuitBreaker(failure_threshold=2, recovery_timeout=1)
 
@@ -209,3 +289,19 @@ class CircuitBreakerTest(TestCase):
         self.assertEqual(result, "recovered")
 
         self.assertEqual(self.cb.state.name, "CLOSED")
+
+
+@patch('app.tasks.get_cache_client')
+class EvaluationCacheTest(SimpleTestCase):
+    """Test the cv_eval result cache used by evaluate_cv_task."""
+
+    def test_cached_evaluation_returned(self, mock_get_cache_client):
+        cached = {'score': 72.0, 'rationale': 'Cached', 'matches': [], 'gaps': []}
+        mock_get_cache_client.return_value.get.return_value = json.dumps(cached).encode()
+
+        self.assertEqual(get_cached_evaluation('abc', 'Developer position', 'model'), cached)
+
+    def test_malformed_cached_evaluation_ignored(self, mock_get_cache_client):
+        for payload in (b'not json', b'[1, 2]', json.dumps({'score': 72.0}).encode()):
+            mock_get_cache_client.return_value.get.return_value = payload
+            self.assertIsNone(get_cached_evaluation('abc', 'Developer position', 'model'))
@@ -0,0 +1,105 @@
+"""
+JWT authentication with a short-lived Redis cache of the token's user.
+"""
+
+import orjson
+import redis
+import structlog
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from app.services.cache_client import get_cache_client
+
+logger = structlog.get_logger(__name__)
+
+USER_CACHE_TTL = 60
+USER_CACHE_KEY_PREFIX = 'auth_user:'
+# Only what request handling reads. Secrets and privilege flags (password,
+# is_staff, is_superuser) never leave the database; on a cached user they are
+# deferred and loaded with a query if something does read them.
+USER_CACHE_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name', 'job_position',
+    'is_active', 'date_joined', 'last_login',
+)
+
+
+def _user_cache_key(user_id):
+    return f'{USER_CACHE_KEY_PREFIX}{user_id}'
+
+
+def _dump_user(user):
+    """Encode the cacheable column values as JSON; never pickle what Redis hands back."""
+    return orjson.dumps({name: getattr(user, name) for name in USER_CACHE_FIELDS})
+
+
+def _load_user(model, payload):
+    """
+    Rebuild a user from _dump_user output as if it was loaded from the
+    database with .only(*USER_CACHE_FIELDS), so saving it writes just those
+    columns. Returns None for anything that doesn't match the current model.
+    """
+    try:
+        data = orjson.loads(payload)
+        names = list(USER_CACHE_FIELDS)
+        values = [
+            None if data[name] is None else model._meta.get_field(name).to_python(data[name])
+            for name in names
+        ]
+    except (orjson.JSONDecodeError, TypeError, KeyError, ValidationError):
+        return None
+    return model.from_db(DEFAULT_DB_ALIAS, names, values)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves request.user from Redis for USER_CACHE_TTL
+    seconds instead of selecting the user row on every request.
+
+    Only users that passed the stock checks are cached, and any save or delete
+    of the user drops the entry, so profile, password and activation changes
+    take effect on the next request.
+    """
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            user = result[0]
+            # DRF authenticates inside the view, after the middleware chain has
+            # run; RequestLoggingMiddleware clears the log context when the request ends
+            structlog.contextvars.bind_contextvars(user_id=str(user.pk), user_email=user.email)
+        return result
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        key = _user_cache_key(user_id)
+        cache = get_cache_client()
+        try:
+            cached = cache.get(key)
+        except redis.RedisError as e:
+            logger.warning("Auth user cache read failed", error=str(e))
+            cached = None
+        if cached:
+            user = _load_user(self.user_model, cached)
+            # Anything stale, foreign or malformed falls back to the database
+            if user is not None and user.is_active and str(user.pk) == str(user_id):
+                return user
+
+        user = super().get_user(validated_token)
+        try:
+            cache.setex(key, USER_CACHE_TTL, _dump_user(user))
+        except (redis.RedisError, TypeError) as e:
+            logger.warning("Auth user cache write failed", error=str(e))
+        return user
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """post_save/post_delete receiver for the user model, connected in AppConfig.ready()."""
+    try:
+        get_cache_client().delete(_user_cache_key(getattr(instance, api_settings.USER_ID_FIELD)))
+    except redis.RedisError as e:
+        logger.warning("Auth user cache invalidation failed", error=str(e))
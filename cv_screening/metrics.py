@@ -2,12 +2,21 @@
 Prometheus metrics configuration for CV screening platform.
 """
 
-from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
+from django.http import HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, Gauge, CollectorRegistry, generate_latest
+import functools
+import threading
 import time
 
 # Create a custom registry to avoid conflicts with Django's metrics
 registry = CollectorRegistry()
 
+# Buckets sized to this API's latencies instead of the 15-bucket default:
+# cached and health responses take a few milliseconds, most API calls tens of
+# milliseconds, uploads up to several seconds; AI evaluations take seconds to minutes
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+EVALUATION_DURATION_BUCKETS = (1.0, 5.0, 15.0, 60.0, 300.0, float('inf'))
+
 # Request metrics
 REQUEST_COUNT = Counter(
     'cv_screening_requests_total',
@@ -20,6 +29,7 @@ REQUEST_LATENCY = Histogram(
     'cv_screening_request_duration_seconds',
     'Request duration in seconds',
     ['method', 'endpoint'],
+    buckets=REQUEST_LATENCY_BUCKETS,
     registry=registry
 )
 
@@ -34,6 +44,7 @@ CV_EVALUATION_COUNT = Counter(
 CV_EVALUATION_DURATION = Histogram(
     'cv_screening_evaluation_duration_seconds',
     'CV evaluation duration in seconds',
+    buckets=EVALUATION_DURATION_BUCKETS,
     registry=registry
 )
 
@@ -86,6 +97,7 @@ AI_REQUEST_DURATION = Histogram(
     'cv_screening_ai_request_duration_seconds',
     'AI request duration in seconds',
     ['service'],
+    buckets=EVALUATION_DURATION_BUCKETS,
     registry=registry
 )
 
@@ -105,9 +117,48 @@ CIRCUIT_BREAKER_FAILURES = Counter(
 )
 
 
+# Back-to-back scrapes (several Prometheus replicas, retries) reuse one rendering
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = {'expires_at': 0.0, 'payload': b''}
+_metrics_lock = threading.Lock()
+
+
 def get_metrics() -> bytes:
     """Get Prometheus metrics in the correct format."""
-    return generate_latest(registry)
+    if time.monotonic() < _metrics_cache['expires_at']:
+        return _metrics_cache['payload']
+
+    with _metrics_lock:
+        # Another thread may have refreshed the payload while we waited
+        now = time.monotonic()
+        if now >= _metrics_cache['expires_at']:
+            _metrics_cache['payload'] = generate_latest(registry)
+            _metrics_cache['expires_at'] = now + METRICS_CACHE_TTL
+        return _metrics_cache['payload']
+
+
+def metrics_view(request):
+    """Serve the exposition with Prometheus' versioned text content type."""
+    return HttpResponse(get_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+METRICS_PATH = '/metrics/'
+
+
+@functools.lru_cache(maxsize=4096)
+def _request_count_child(method, endpoint, status):
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+
+
+@functools.lru_cache(maxsize=4096)
+def _request_latency_child(method, endpoint):
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+
+def _endpoint_label(request):
+    """URL route pattern for the request, so ids in the path don't become labels."""
+    match = getattr(request, 'resolver_match', None)
+    return match.route if match is not None else 'unmatched'
 
 
 class MetricsMiddleware:
@@ -119,21 +170,18 @@ class MetricsMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        start_time = time.time()
+        # Don't record the scrape endpoint's own traffic
+        if request.path == METRICS_PATH:
+            return self.get_response(request)
+
+        start_time = time.perf_counter()
 
         response = self.get_response(request)
 
         # Record request metrics
-        duration = time.time() - start_time
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.path,
-            status=response.status_code
-        ).inc()
-
-        REQUEST_LATENCY.labels(
-            method=request.method,
-            endpoint=request.path
-        ).observe(duration)
+        duration = time.perf_counter() - start_time
+        endpoint = _endpoint_label(request)
+        _request_count_child(request.method, endpoint, response.status_code).inc()
+        _request_latency_child(request.method, endpoint).observe(duration)
 
         return response
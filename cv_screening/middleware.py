@@ -2,10 +2,29 @@
 Middleware for request tracking and logging.
 """
 
+import os
+import random
 import time
-import uuid
 import structlog
 from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+
+logger = structlog.get_logger()
+
+# Prometheus scrapes and static/media files don't need per-request log lines
+UNLOGGED_PATHS = frozenset({'/metrics/'})
+UNLOGGED_PREFIXES = ('/static/', '/media/')
+
+# Request ids only need to be unique, not unpredictable: draw them from a
+# per-process PRNG instead of uuid4's urandom syscall, reseeding after fork
+# so worker processes don't repeat each other's ids
+_request_id_rng = random.Random()
+os.register_at_fork(after_in_child=_request_id_rng.seed)
+
+
+def new_request_id():
+    """Return a random 32-character hex request id."""
+    return '%032x' % _request_id_rng.getrandbits(128)
 
 
 class RequestLoggingMiddleware:
@@ -17,68 +36,89 @@ class RequestLoggingMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        request_id = str(uuid.uuid4())
-        with structlog.contextvars.bound_contextvars(
+        path = request.path
+        if path in UNLOGGED_PATHS or path.startswith(UNLOGGED_PREFIXES):
+            return self.get_response(request)
+
+        request_id = new_request_id()
+        # Bind once for everything logged during the request; one-off fields
+        # go straight to the log call instead of a nested context
+        structlog.contextvars.bind_contextvars(
             request_id=request_id,
             method=request.method,
-            path=request.path,
+            path=path,
             user_agent=request.META.get('HTTP_USER_AGENT', ''),
             remote_addr=self._get_client_ip(request),
-        ):
-            structlog.get_logger().info("request_started")
+        )
+        try:
+            logger.info("request_started")
 
             request.request_id = request_id
-
-            start_time = time.time()
-
-            try:
-                response = self.get_response(request)
-
-                duration = time.time() - start_time
-                with structlog.contextvars.bound_contextvars(
-                    status_code=response.status_code,
-                    duration=f"{duration:.4f}s",
-                ):
-                    structlog.get_logger().info("request_completed")
-
-                return response
-
-            except Exception as exc:
-                duration = time.time() - start_time
-                with structlog.contextvars.bound_contextvars(
-                    status_code=500,
-                    duration=f"{duration:.4f}s",
-                    error=str(exc),
-                    error_type=type(exc).__name__,
-                ):
-                    structlog.get_logger().error("request_failed")
-
-                raise
+            request.log_start_time = start_time = time.perf_counter()
+
+            # Django turns exceptions raised below into error responses before
+            # they get here; view failures are logged by process_exception
+            response = self.get_response(request)
+
+            duration = time.perf_counter() - start_time
+            logger.info(
+                "request_completed",
+                status_code=response.status_code,
+                duration_s=duration,
+            )
+            return response
+        finally:
+            # This is the outermost binder, so nothing needs restoring: drop
+            # the whole request context in one go
+            structlog.contextvars.clear_contextvars()
+
+    def process_exception(self, request, exception):
+        """Log an unhandled view exception; Django then builds the 500 response."""
+        start_time = getattr(request, 'log_start_time', None)
+        if start_time is None:
+            return None
+        logger.error(
+            "request_failed",
+            status_code=500,
+            duration_s=time.perf_counter() - start_time,
+            error=str(exception),
+            error_type=type(exception).__name__,
+        )
+        return None
 
     def _get_client_ip(self, request):
         """Get the client's IP address."""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        meta = request.META
+        x_forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
+            # Only the first hop is wanted; don't split the whole proxy chain
+            ip = x_forwarded_for.partition(',')[0].strip()
         else:
-            ip = request.META.get('REMOTE_ADDR')
+            ip = meta.get('REMOTE_ADDR')
         return ip
 
 
-class UserContextMiddleware:
+# Only JSON under the API prefix is compressed. Auth endpoints return tokens
+# next to request-reflected input, and compressing those together leaks the
+# secret through the compressed size (BREACH), so they are never gzipped.
+GZIP_PATH_PREFIX = '/api/'
+GZIP_EXCLUDED_PREFIXES = ('/api/auth/',)
+GZIP_CONTENT_TYPE = 'application/json'
+
+
+class APIGZipMiddleware(GZipMiddleware):
     """
-    Middleware to add user context to logging for authenticated requests.
+    Gzip buffered JSON API responses. Streamed downloads (PDFs) are already
+    compressed, and admin pages, metrics and auth responses are left alone.
     """
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            with structlog.contextvars.bound_contextvars(
-                user_id=str(request.user.id),
-                user_email=request.user.email,
-            ):
-                return self.get_response(request)
-        else:
-            return self.get_response(request)
+    def process_response(self, request, response):
+        path = request.path
+        if (
+            response.streaming
+            or not path.startswith(GZIP_PATH_PREFIX)
+            or path.startswith(GZIP_EXCLUDED_PREFIXES)
+            or not response.get('Content-Type', '').startswith(GZIP_CONTENT_TYPE)
+        ):
+            return response
+        return super().process_response(request, response)
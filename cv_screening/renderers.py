@@ -0,0 +1,29 @@
+"""
+JSON renderer backed by orjson.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Lazy strings, Decimals and the like fall back to DRF's own encoding
+_fallback_encoder = JSONEncoder()
+
+# Match DRF's output: UTC datetimes end in "Z", non-string keys are stringified
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer that encodes with orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        # orjson only supports two-space indentation; leave pretty-printing to DRF
+        if self.get_indent(accepted_media_type or '', renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=_fallback_encoder.default, option=ORJSON_OPTIONS)
@@ -47,11 +47,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Outermost of our own middleware so request latency covers everything below
+    'cv_screening.metrics.MetricsMiddleware',
+    'cv_screening.middleware.APIGZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'cv_screening.middleware.RequestLoggingMiddleware',
-    'cv_screening.middleware.UserContextMiddleware',
-    'cv_screening.metrics.MetricsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -92,6 +93,11 @@ DATABASES = {
         'PORT': os.getenv('MYSQL_PORT', '3306'),
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+            # Fail fast instead of hanging requests and the health probe on an
+            # unreachable server (libmysqlclient retries reads, so reads can take 3x)
+            'connect_timeout': int(os.getenv('MYSQL_CONNECT_TIMEOUT', '3')),
+            'read_timeout': int(os.getenv('MYSQL_READ_TIMEOUT', '10')),
+            'write_timeout': int(os.getenv('MYSQL_WRITE_TIMEOUT', '10')),
         },
     }
 }
@@ -161,12 +167,16 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'cv_screening.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': [
+        'cv_screening.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
         'rest_framework.parsers.FormParser',
@@ -230,14 +240,39 @@ AWS_DEFAULT_ACL = 'private'
 AWS_S3_OBJECT_PARAMETERS = {
     'CacheControl': 'max-age=86400',
 }
+# S3File buffers a whole object in a SpooledTemporaryFile before the first
+# read; past this size it spills to disk instead of holding the CV in memory
+AWS_S3_MAX_MEMORY_SIZE = 1024 * 1024
 
 # For MinIO, we need to disable SSL verification and use path-style addressing
 AWS_S3_USE_SSL = os.getenv('AWS_S3_USE_SSL', 'False').lower() == 'true'
 AWS_S3_ADDRESSING_STYLE = 'path'
 
+# Shared botocore config: pooled keep-alive connections and standard retries
+from botocore.client import Config as BotoConfig
+
+AWS_S3_CLIENT_CONFIG = BotoConfig(
+    signature_version='s3v4',
+    s3={'addressing_style': AWS_S3_ADDRESSING_STYLE},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+)
+
+# Redirect CV downloads to short-lived presigned S3 URLs instead of proxying
+# the bytes through Django; needs an endpoint reachable by clients
+CV_FILE_REDIRECT = os.getenv('CV_FILE_REDIRECT', 'False').lower() == 'true'
+CV_FILE_URL_TTL = int(os.getenv('CV_FILE_URL_TTL', 300))
+
 # OpenRouter AI API settings
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 
+# Upper bound on CV text parsed and passed to the AI client; the single
+# limit used by the parser, the evaluation service and the OpenRouter prompt
+CV_MAX_CHARS = int(os.getenv('CV_MAX_CHARS', 8000))
+
 # Celery settings
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/0')
@@ -245,20 +280,34 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BROKER_POOL_LIMIT = int(os.getenv('CELERY_BROKER_POOL_LIMIT', 10))
+CELERY_BROKER_TRANSPORT_OPTIONS = {'socket_keepalive': True}
+# Evaluation tasks spend most of their time waiting on the AI API, so run more
+# worker processes than cores and hand each one a single task at a time
+CELERY_WORKER_CONCURRENCY = int(os.getenv('CELERY_WORKER_CONCURRENCY', 8))
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Keep CV evaluations and operational tasks on separate queues so neither
+# waits behind the other; workers must consume cv, celery and debug
+CELERY_TASK_ROUTES = {
+    'app.tasks.evaluate_cv_task': {'queue': 'cv'},
+    'cv_screening.celery.debug_task': {'queue': 'debug'},
+}
 
 # Structlog Configuration
+import orjson
 import structlog
 
+# orjson renders straight to bytes, which BytesLogger writes without re-encoding
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
     wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
-    logger_factory=structlog.WriteLoggerFactory(),
+    logger_factory=structlog.BytesLoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
@@ -273,7 +322,10 @@ LOGGING = {
         },
         'json': {
             '()': 'structlog.stdlib.ProcessorFormatter',
-            'processor': structlog.processors.JSONRenderer(),
+            # logging formatters must return str
+            'processor': structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode()
+            ),
         },
     },
     'handlers': {
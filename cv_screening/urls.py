@@ -4,11 +4,10 @@ URL configuration for cv_screening project.
 
 from django.contrib import admin
 from django.urls import path, include
-from django.http import HttpResponse
 from django.conf import settings
 from django.conf.urls.static import static
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
-from cv_screening.metrics import get_metrics
+from cv_screening.metrics import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -17,7 +16,7 @@ urlpatterns = [
     path('api/', include('app.urls')),
 
     # Metrics endpoint
-    path('metrics/', lambda request: HttpResponse(get_metrics(), content_type='text/plain'), name='prometheus-metrics'),
+    path('metrics/', metrics_view, name='prometheus-metrics'),
 
     # API documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),